@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import platform
 from abc import ABC, abstractmethod
-from typing import Any, Protocol, TypeVar, runtime_checkable
+from functools import partial
+from typing import Any, Callable, Protocol, TypeVar, runtime_checkable
 
 from continuum.doctor.models import CheckResult
 
 Context = dict[str, Any]
 
+# The OS cannot change mid-process, so every check module shares one lookup.
+SYSTEM = platform.system()
+IS_LINUX = SYSTEM == "Linux"
+IS_LINUX_OR_WINDOWS = SYSTEM in ("Linux", "Windows")
+_TEARDOWN_KEY = "_teardown"
+
 
 @runtime_checkable
 class Check(Protocol):
@@ -19,9 +27,18 @@ class Check(Protocol):
 
 
 class BaseCheck(ABC):
+    __slots__ = ()
+
     id: str
     title: str
     category: str
+    _make_result: Callable[..., CheckResult]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Bind the identity fields once per class; run() only supplies the outcome.
+        if all(hasattr(cls, name) for name in ("id", "title", "category")):
+            cls._make_result = partial(CheckResult, id=cls.id, title=cls.title, category=cls.category)
 
     def should_run(self, context: Context) -> bool:
         return True
@@ -33,12 +50,14 @@ class BaseCheck(ABC):
 
 CheckClass = type[BaseCheck]
 _CheckT = TypeVar("_CheckT", bound=CheckClass)
-_CHECK_REGISTRY: list[CheckClass] = []
+# Insertion-ordered: O(1) duplicate checks. Checks hold no per-run state, so each
+# class is instantiated once at registration and the instance is shared.
+_CHECK_REGISTRY: dict[CheckClass, BaseCheck] = {}
 
 
 def register_check(check_cls: _CheckT) -> _CheckT:
     if check_cls not in _CHECK_REGISTRY:
-        _CHECK_REGISTRY.append(check_cls)
+        _CHECK_REGISTRY[check_cls] = check_cls()
     return check_cls
 
 
@@ -46,10 +65,34 @@ def list_checks() -> list[CheckClass]:
     return list(_CHECK_REGISTRY)
 
 
+def list_check_instances() -> list[BaseCheck]:
+    return list(_CHECK_REGISTRY.values())
+
+
+def register_teardown(context: Context, callback: Callable[[], object]) -> None:
+    """Queue ``callback`` to run once the doctor runner has finished every check."""
+    context.setdefault(_TEARDOWN_KEY, []).append(callback)
+
+
+def run_teardown(context: Context) -> None:
+    callbacks = context.pop(_TEARDOWN_KEY, None) or []
+    for callback in reversed(callbacks):
+        try:
+            callback()
+        except Exception:  # noqa: BLE001
+            pass
+
+
 __all__ = [
     "Context",
+    "SYSTEM",
+    "IS_LINUX",
+    "IS_LINUX_OR_WINDOWS",
     "Check",
     "BaseCheck",
     "register_check",
     "list_checks",
+    "list_check_instances",
+    "register_teardown",
+    "run_teardown",
 ]
@@ -1,30 +1,22 @@
 from __future__ import annotations
 
-import platform
+import os
 import re
 import shutil
 import subprocess
-from pathlib import Path
-
-try:
-    from packaging.version import Version
-except Exception:  # pragma: no cover
-    class Version:  # type: ignore[no-redef]
-        def __init__(self, value: str) -> None:
-            self.parts = tuple(int(part) for part in re.findall(r"\d+", value))
-
-        def __ge__(self, other: object) -> bool:
-            if not isinstance(other, Version):
-                return NotImplemented
-            max_len = max(len(self.parts), len(other.parts))
-            left = self.parts + (0,) * (max_len - len(self.parts))
-            right = other.parts + (0,) * (max_len - len(other.parts))
-            return left >= right
-
-from continuum.doctor.checks.base import BaseCheck, Context, register_check
+
+from continuum.doctor.checks.base import IS_LINUX, IS_LINUX_OR_WINDOWS, SYSTEM, BaseCheck, Context, register_check
 from continuum.doctor.models import CheckResult, Status
+from continuum.doctor.utils.nvml import nvml_session
+from continuum.doctor.utils.process import run_cached
+
+_PASS, _WARN, _FAIL = Status.PASS, Status.WARN, Status.FAIL
 
 _MAX_CAPTURE_LEN = 2000
+_CUDA_ROOT = "/usr/local/cuda"
+_DIGITS_RE = re.compile(r"\d+")
+_VERSION_RE = re.compile(r"(\d+\.\d+(?:\.\d+)?)")
+_NVCC_RELEASE_RE = re.compile(r"release\s+(\d+\.\d+)", re.IGNORECASE)
 _CUDA_DRIVER_MIN = {
     "11.8": "520.61.05",
     "12.1": "530.30.02",
@@ -35,14 +27,53 @@ _CUDA_DRIVER_MIN = {
 
 
 def _truncate_text(value: str | None, limit: int = _MAX_CAPTURE_LEN) -> str:
-    text = (value or "").strip()
-    if len(text) <= limit:
-        return text
-    return f"{text[:limit]}...<truncated>"
+    if not value:
+        return ""
+    if len(value) <= limit:
+        return value.strip()
+    # Long buffers: locate the stripped bounds instead of copying the whole
+    # capture, since only the first ``limit`` characters survive.
+    start = 0
+    end = len(value)
+    while start < end and value[start].isspace():
+        start += 1
+    while end > start and value[end - 1].isspace():
+        end -= 1
+    if end - start <= limit:
+        return value[start:end]
+    return f"{value[start:start + limit]}...<truncated>"
+
+
+def _version_tuple(value: str) -> tuple[int, ...]:
+    # Driver versions are plain dotted integers, so skip PEP 440 parsing.
+    try:
+        parts = tuple(int(part) for part in value.split("."))
+    except ValueError:
+        parts = tuple(int(part) for part in _DIGITS_RE.findall(value))
+    if not parts:
+        raise ValueError(f"Unparseable version: {value!r}")
+    return parts
+
+
+def _version_gte(left: str, right: str) -> bool:
+    left_parts = _version_tuple(left)
+    right_parts = _version_tuple(right)
+    width = max(len(left_parts), len(right_parts))
+    return left_parts + (0,) * (width - len(left_parts)) >= right_parts + (0,) * (width - len(right_parts))
+
+
+def _nvidia_device_present() -> bool:
+    if IS_LINUX:
+        # /dev/dxg is the GPU paravirtualisation node under WSL2.
+        return os.path.exists("/dev/nvidia0") or os.path.exists("/dev/dxg")
+    if SYSTEM == "Windows":
+        system_root = os.environ.get("SystemRoot", r"C:\Windows")
+        return os.path.exists(os.path.join(system_root, "System32", "nvml.dll"))
+    return True
 
 
 def _is_linux_or_windows() -> bool:
-    return platform.system() in {"Linux", "Windows"}
+    return IS_LINUX_OR_WINDOWS
 
 
 def _results(context: Context) -> dict[str, CheckResult]:
@@ -60,31 +91,24 @@ def _facts(context: Context) -> dict[str, object]:
 
 
 def _extract_version(text: str) -> str | None:
-    match = re.search(r"(\d+\.\d+(?:\.\d+)?)", text)
+    match = _VERSION_RE.search(text)
     return match.group(1) if match else None
 
 
-def _driver_version_from_nvml() -> str | None:
+def _driver_version_from_nvml(context: Context) -> str | None:
+    pynvml = nvml_session(context).pynvml
+    if pynvml is None:
+        return None
     try:
-        import pynvml  # type: ignore[import-not-found]
-
-        pynvml.nvmlInit()
         raw = pynvml.nvmlSystemGetDriverVersion()
-        if isinstance(raw, bytes):
-            return raw.decode("utf-8", errors="replace").strip()
-        return str(raw).strip()
     except Exception:  # noqa: BLE001
         return None
-    finally:
-        try:
-            import pynvml  # type: ignore[import-not-found]
-
-            pynvml.nvmlShutdown()
-        except Exception:  # noqa: BLE001
-            pass
+    if isinstance(raw, bytes):
+        return raw.decode("utf-8", errors="replace").strip()
+    return str(raw).strip()
 
 
-def _driver_version_from_nvidia_smi() -> tuple[str | None, dict[str, object]]:
+def _driver_version_from_nvidia_smi(context: Context) -> tuple[str | None, dict[str, object]]:
     smi_path = shutil.which("nvidia-smi")
     details: dict[str, object] = {
         "nvidia_smi_path": smi_path,
@@ -97,46 +121,52 @@ def _driver_version_from_nvidia_smi() -> tuple[str | None, dict[str, object]]:
         return None, details
 
     try:
-        query = subprocess.run(
-            [smi_path, "--query-gpu=driver_version", "--format=csv,noheader"],
-            capture_output=True,
-            text=True,
-            timeout=15,
-            check=False,
+        query: subprocess.CompletedProcess[str] = run_cached(
+            context,
+            (smi_path, "--query-gpu=driver_version,name,persistence_mode", "--format=csv,noheader,nounits"),
         )
         details["returncode"] = query.returncode
         details["stdout"] = _truncate_text(query.stdout)
         details["stderr"] = _truncate_text(query.stderr)
         if query.returncode == 0:
             first = next((line.strip() for line in query.stdout.splitlines() if line.strip()), "")
-            version = _extract_version(first)
+            driver_field, _, rest = first.partition(",")
+            name_field, _, persistence_field = rest.rpartition(",")
+            version = _extract_version(driver_field)
             if version is not None:
                 details["parse_source"] = "query-gpu"
+                details["gpu_name"] = name_field.strip() or None
+                details["persistence_mode"] = persistence_field.strip().lower() or None
                 return version, details
-
-        fallback = subprocess.run(
-            [smi_path],
-            capture_output=True,
-            text=True,
-            timeout=15,
-            check=False,
-        )
-        details["returncode"] = fallback.returncode
-        details["stdout"] = _truncate_text(fallback.stdout)
-        details["stderr"] = _truncate_text(fallback.stderr)
-        if fallback.returncode == 0:
-            line_match = re.search(r"Driver Version:\s*([0-9][0-9.\-]*)", fallback.stdout)
-            if line_match:
-                details["parse_source"] = "default-output"
-                return line_match.group(1), details
     except Exception as exc:  # noqa: BLE001
         details["stderr"] = _truncate_text(str(exc))
 
     return None, details
 
 
-def _get_cuda_version_from_facts(context: Context) -> str | None:
+def _resolve_driver_version(context: Context) -> tuple[str | None, str, dict[str, object]]:
+    """Resolve the driver version once per run; the only writer of facts["driver_version"]."""
     facts = _facts(context)
+    cached = facts.get("_driver_resolution")
+    if isinstance(cached, tuple):
+        return cached
+
+    if "_nvml_driver_version" not in facts:
+        facts["_nvml_driver_version"] = _driver_version_from_nvml(context)
+    nvml_version = facts["_nvml_driver_version"]
+    if nvml_version:
+        resolution: tuple[str | None, str, dict[str, object]] = (nvml_version, "nvml", {})
+    else:
+        smi_version, smi_details = _driver_version_from_nvidia_smi(context)
+        resolution = (smi_version, "nvidia-smi" if smi_version else "unknown", smi_details)
+
+    if resolution[0]:
+        facts["driver_version"] = resolution[0]
+    facts["_driver_resolution"] = resolution
+    return resolution
+
+
+def _get_cuda_version_from_facts(facts: dict[str, object]) -> str | None:
     for key in ("torch_cuda_version", "nvcc_version"):
         value = facts.get(key)
         if isinstance(value, str) and value:
@@ -154,45 +184,57 @@ class CudaDriverVersionCheck(BaseCheck):
         return _is_linux_or_windows()
 
     def run(self, context: Context) -> CheckResult:
-        facts = _facts(context)
-        nvml_version = _driver_version_from_nvml()
-        if nvml_version:
-            facts["driver_version"] = nvml_version
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
-                status=Status.PASS,
+        # A stat on the device node is far cheaper than importing NVML or
+        # scanning PATH for nvidia-smi on the common GPU-less host. Hosts whose
+        # driver exposes no device node can opt back in to the nvidia-smi probe.
+        if not _nvidia_device_present() and not os.environ.get("CONTINUUM_PROBE_NVIDIA_SMI"):
+            return self._not_detected(
+                {
+                    "nvidia_smi_path": None,
+                    "returncode": None,
+                    "stdout": "",
+                    "stderr": "",
+                    "parse_source": None,
+                },
+                smi_present=False,
+            )
+
+        version, method_used, smi_details = _resolve_driver_version(context)
+        if method_used == "nvml":
+            return self._make_result(
+                status=_PASS,
                 message="Detected NVIDIA driver version via NVML.",
-                details={"driver_version": nvml_version, "method_used": "nvml"},
+                details={"driver_version": version, "method_used": "nvml"},
                 remediation=None,
                 severity=0,
             )
 
-        smi_version, smi_details = _driver_version_from_nvidia_smi()
         smi_present = bool(smi_details.get("nvidia_smi_path"))
-        if smi_version:
-            facts["driver_version"] = smi_version
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
-                status=Status.PASS,
+        if method_used == "nvidia-smi":
+            # With persistence mode off every nvidia-smi call re-initialises the
+            # driver, which is what makes doctor runs slow on those hosts.
+            persistence_off = smi_details.get("persistence_mode") == "disabled"
+            return self._make_result(
+                status=_PASS,
                 message="Detected NVIDIA driver version via nvidia-smi.",
                 details={
-                    "driver_version": smi_version,
+                    "driver_version": version,
                     "method_used": "nvidia-smi",
                     **smi_details,
                 },
-                remediation=None,
+                remediation=[
+                    "Enable persistence mode to avoid slow nvidia-smi startup: sudo nvidia-smi -pm 1",
+                ]
+                if persistence_off
+                else None,
                 severity=0,
             )
 
-        return CheckResult(
-            id=self.id,
-            title=self.title,
-            category=self.category,
-            status=Status.FAIL if smi_present else Status.WARN,
+        return self._not_detected(smi_details, smi_present)
+
+    def _not_detected(self, smi_details: dict[str, object], smi_present: bool) -> CheckResult:
+        return self._make_result(
+            status=_FAIL if smi_present else _WARN,
             message="Unable to detect NVIDIA driver version.",
             details={
                 "driver_version": None,
@@ -215,7 +257,16 @@ class CudaToolkitNvccCheck(BaseCheck):
     category = "cuda"
 
     def should_run(self, context: Context) -> bool:
-        return _is_linux_or_windows()
+        if not _is_linux_or_windows():
+            return False
+        if os.environ.get("CONTINUUM_REQUIRE_NVCC"):
+            return True
+        # On hosts where the driver probe already found no NVIDIA driver and no
+        # GPUs are known, nvcc --version is a wasted subprocess.
+        driver = _results(context).get("cuda.driver_version")
+        gpu_count = _facts(context).get("gpu_count", 0)
+        no_gpu = not (isinstance(gpu_count, int) and gpu_count > 0)
+        return not (no_gpu and driver is not None and driver.status != _PASS)
 
     def run(self, context: Context) -> CheckResult:
         facts = _facts(context)
@@ -230,11 +281,8 @@ class CudaToolkitNvccCheck(BaseCheck):
         }
 
         if nvcc_path is None:
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
-                status=Status.WARN,
+            return self._make_result(
+                status=_WARN,
                 message="nvcc not found; runtime-only CUDA environments are common.",
                 details=details,
                 remediation=[
@@ -244,18 +292,12 @@ class CudaToolkitNvccCheck(BaseCheck):
             )
 
         try:
-            proc = subprocess.run(
-                [nvcc_path, "--version"],
-                capture_output=True,
-                text=True,
-                timeout=15,
-                check=False,
-            )
+            proc: subprocess.CompletedProcess[str] = run_cached(context, (nvcc_path, "--version"))
             details["returncode"] = proc.returncode
             details["stdout"] = _truncate_text(proc.stdout)
             details["stderr"] = _truncate_text(proc.stderr)
             version = None
-            rel_match = re.search(r"release\s+(\d+\.\d+)", proc.stdout, flags=re.IGNORECASE)
+            rel_match = _NVCC_RELEASE_RE.search(proc.stdout)
             if rel_match:
                 version = rel_match.group(1)
             if version is None:
@@ -263,11 +305,8 @@ class CudaToolkitNvccCheck(BaseCheck):
             details["nvcc_version"] = version
             if proc.returncode == 0 and version is not None:
                 facts["nvcc_version"] = version
-                return CheckResult(
-                    id=self.id,
-                    title=self.title,
-                    category=self.category,
-                    status=Status.PASS,
+                return self._make_result(
+                    status=_PASS,
                     message="nvcc detected with parseable CUDA toolkit version.",
                     details=details,
                     remediation=None,
@@ -276,11 +315,8 @@ class CudaToolkitNvccCheck(BaseCheck):
         except Exception as exc:  # noqa: BLE001
             details["stderr"] = _truncate_text(str(exc))
 
-        return CheckResult(
-            id=self.id,
-            title=self.title,
-            category=self.category,
-            status=Status.WARN,
+        return self._make_result(
+            status=_WARN,
             message="nvcc found but CUDA toolkit version could not be parsed.",
             details=details,
             remediation=[
@@ -298,18 +334,15 @@ class CudaTorchCudaVersionCheck(BaseCheck):
 
     def should_run(self, context: Context) -> bool:
         installed = _results(context).get("pytorch.installed")
-        return installed is not None and installed.status == Status.PASS
+        return installed is not None and installed.status == _PASS
 
     def run(self, context: Context) -> CheckResult:
         facts = _facts(context)
         try:
             import torch  # type: ignore[import-not-found]
         except Exception as exc:  # noqa: BLE001
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
-                status=Status.FAIL,
+            return self._make_result(
+                status=_FAIL,
                 message="Unable to import torch for CUDA version detection.",
                 details={"import_error": f"{type(exc).__name__}: {exc}"},
                 remediation=[
@@ -330,11 +363,8 @@ class CudaTorchCudaVersionCheck(BaseCheck):
         }
 
         if cuda_version is None and gpu_present:
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
-                status=Status.WARN,
+            return self._make_result(
+                status=_WARN,
                 message="GPU detected but torch.version.cuda is not set.",
                 details=details,
                 remediation=[
@@ -343,11 +373,8 @@ class CudaTorchCudaVersionCheck(BaseCheck):
                 severity=1,
             )
 
-        return CheckResult(
-            id=self.id,
-            title=self.title,
-            category=self.category,
-            status=Status.PASS,
+        return self._make_result(
+            status=_PASS,
             message="Collected torch CUDA version metadata.",
             details=details,
             remediation=None,
@@ -364,15 +391,15 @@ class CudaDriverCompatCheck(BaseCheck):
     def should_run(self, context: Context) -> bool:
         facts = _facts(context)
         driver_version = facts.get("driver_version")
-        cuda_version = _get_cuda_version_from_facts(context)
+        cuda_version = _get_cuda_version_from_facts(facts)
         return isinstance(driver_version, str) and bool(driver_version) and isinstance(cuda_version, str) and bool(cuda_version)
 
     def run(self, context: Context) -> CheckResult:
         facts = _facts(context)
         driver_version = str(facts.get("driver_version"))
-        cuda_version_raw = str(_get_cuda_version_from_facts(context))
-        cuda_key_match = re.match(r"^(\d+\.\d+)", cuda_version_raw)
-        cuda_key = cuda_key_match.group(1) if cuda_key_match else cuda_version_raw
+        cuda_version_raw = str(_get_cuda_version_from_facts(facts))
+        parts = cuda_version_raw.split(".", 2)
+        cuda_key = f"{parts[0]}.{parts[1]}" if len(parts) >= 2 else cuda_version_raw
         required = _CUDA_DRIVER_MIN.get(cuda_key)
 
         details = {
@@ -382,11 +409,8 @@ class CudaDriverCompatCheck(BaseCheck):
         }
 
         if required is None:
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
-                status=Status.WARN,
+            return self._make_result(
+                status=_WARN,
                 message="CUDA version not present in built-in compatibility table.",
                 details=details,
                 remediation=[
@@ -397,13 +421,10 @@ class CudaDriverCompatCheck(BaseCheck):
             )
 
         try:
-            driver_ok = Version(driver_version) >= Version(required)
+            driver_ok = _version_gte(driver_version, required)
         except Exception:  # noqa: BLE001
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
-                status=Status.WARN,
+            return self._make_result(
+                status=_WARN,
                 message="Could not compare driver and CUDA versions.",
                 details=details,
                 remediation=[
@@ -413,11 +434,8 @@ class CudaDriverCompatCheck(BaseCheck):
             )
 
         if not driver_ok:
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
-                status=Status.FAIL,
+            return self._make_result(
+                status=_FAIL,
                 message="NVIDIA driver is below the minimum required for detected CUDA.",
                 details=details,
                 remediation=[
@@ -426,11 +444,8 @@ class CudaDriverCompatCheck(BaseCheck):
                 severity=3,
             )
 
-        return CheckResult(
-            id=self.id,
-            title=self.title,
-            category=self.category,
-            status=Status.PASS,
+        return self._make_result(
+            status=_PASS,
             message="Driver/CUDA compatibility check passed against built-in matrix.",
             details=details,
             remediation=None,
@@ -445,19 +460,15 @@ class CudaRuntimeHintCheck(BaseCheck):
     category = "cuda"
 
     def should_run(self, context: Context) -> bool:
-        return platform.system() == "Linux"
+        return IS_LINUX
 
     def run(self, context: Context) -> CheckResult:
-        cuda_root = Path("/usr/local/cuda")
         details = {
-            "cuda_root_path": str(cuda_root),
-            "cuda_root_exists": cuda_root.exists(),
+            "cuda_root_path": _CUDA_ROOT,
+            "cuda_root_exists": os.path.isdir(_CUDA_ROOT),
         }
-        return CheckResult(
-            id=self.id,
-            title=self.title,
-            category=self.category,
-            status=Status.PASS,
+        return self._make_result(
+            status=_PASS,
             message="Collected CUDA runtime path hint.",
             details=details,
             remediation=None,
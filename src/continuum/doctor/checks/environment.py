@@ -8,6 +8,19 @@ from continuum.doctor.checks.base import BaseCheck, Context, register_check
 from continuum.doctor.models import CheckResult, Status
 from continuum.doctor.utils.platform import is_container, is_wsl
 
+_PASS, _WARN, _FAIL = Status.PASS, Status.WARN, Status.FAIL
+
+# Interpreter prefixes and the activating shell's env are fixed for the life
+# of the process, so evaluate the isolation predicate once.
+_BASE_PREFIX = getattr(sys, "base_prefix", sys.prefix)
+_CONDA_PREFIX = os.environ.get("CONDA_PREFIX")
+_IN_VENV = (
+    hasattr(sys, "real_prefix")
+    or sys.prefix != _BASE_PREFIX
+    or bool(_CONDA_PREFIX)
+    or bool(os.environ.get("CONDA_DEFAULT_ENV"))
+)
+
 
 @register_check
 class PythonVersionCheck(BaseCheck):
@@ -25,11 +38,8 @@ class PythonVersionCheck(BaseCheck):
         }
 
         if (current.major, current.minor) < minimum:
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
-                status=Status.FAIL,
+            return self._make_result(
+                status=_FAIL,
                 message="Python 3.10+ is required.",
                 details=details,
                 remediation=[
@@ -40,11 +50,8 @@ class PythonVersionCheck(BaseCheck):
                 severity=3,
             )
 
-        return CheckResult(
-            id=self.id,
-            title=self.title,
-            category=self.category,
-            status=Status.PASS,
+        return self._make_result(
+            status=_PASS,
             message="Python version is supported.",
             details=details,
             remediation=None,
@@ -59,37 +66,26 @@ class VirtualEnvironmentCheck(BaseCheck):
     category = "environment"
 
     def run(self, context: Context) -> CheckResult:
-        in_venv = (
-            hasattr(sys, "real_prefix")
-            or sys.prefix != getattr(sys, "base_prefix", sys.prefix)
-            or bool(os.environ.get("CONDA_PREFIX"))
-            or bool(os.environ.get("CONDA_DEFAULT_ENV"))
-        )
+        in_venv = _IN_VENV
 
         details = {
             "in_venv": in_venv,
             "sys_prefix": sys.prefix,
-            "sys_base_prefix": getattr(sys, "base_prefix", sys.prefix),
-            "conda_prefix": os.environ.get("CONDA_PREFIX"),
+            "sys_base_prefix": _BASE_PREFIX,
+            "conda_prefix": _CONDA_PREFIX,
         }
 
         if in_venv:
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
-                status=Status.PASS,
+            return self._make_result(
+                status=_PASS,
                 message="Python environment is isolated (venv/conda).",
                 details=details,
                 remediation=None,
                 severity=0,
             )
 
-        return CheckResult(
-            id=self.id,
-            title=self.title,
-            category=self.category,
-            status=Status.WARN,
+        return self._make_result(
+            status=_WARN,
             message="Running on system Python; isolation is recommended.",
             details=details,
             remediation=[
@@ -107,14 +103,17 @@ class RuntimeEnvironmentCheck(BaseCheck):
     category = "environment"
 
     def run(self, context: Context) -> CheckResult:
-        container_flag = is_container()
-        wsl_flag = is_wsl()
-
-        return CheckResult(
-            id=self.id,
-            title=self.title,
-            category=self.category,
-            status=Status.PASS,
+        # DoctorRunner already probed these for the report environment; only
+        # re-read /proc when the check runs outside the runner.
+        container_flag = context.get("is_container")
+        if not isinstance(container_flag, bool):
+            container_flag = is_container()
+        wsl_flag = context.get("is_wsl")
+        if not isinstance(wsl_flag, bool):
+            wsl_flag = is_wsl()
+
+        return self._make_result(
+            status=_PASS,
             message="Runtime environment detected.",
             details={
                 "is_container": container_flag,
@@ -1,14 +1,66 @@
 from __future__ import annotations
 
-import platform
+import csv
+import os
 import shutil
 import subprocess
-from pathlib import Path
-
-from continuum.doctor.checks.base import BaseCheck, Context, register_check
+from functools import cache, reduce
+from operator import or_
+from types import ModuleType
+
+from continuum.doctor.checks.base import (
+    IS_LINUX,
+    IS_LINUX_OR_WINDOWS,
+    BaseCheck,
+    Context,
+    register_check,
+    register_teardown,
+)
 from continuum.doctor.models import CheckResult, Status
+from continuum.doctor.utils.nvml import nvml_session
+from continuum.doctor.utils.process import run_cached
 
 _MAX_CAPTURE_LEN = 2000
+_MAX_DEVICE_NODES = 32
+_MAX_DEVICES = 8
+_SMI_DEVICE_QUERY = (
+    "--query-gpu=index,name,persistence_mode,temperature.gpu,power.draw,clocks_throttle_reasons.active",
+    "--format=csv,noheader,nounits",
+)
+# Constant result fragments: shared rather than rebuilt on every run.
+_NVIDIA_SMI_OK = {
+    "status": Status.PASS,
+    "message": "nvidia-smi detected and operational.",
+    "remediation": None,
+    "severity": 0,
+}
+_NVIDIA_SMI_MISSING_REMEDIATION = (
+    "Install NVIDIA drivers for your platform.",
+    "Verify nvidia-smi is in PATH.",
+)
+_NVIDIA_SMI_EXEC_REMEDIATION = (
+    "Install NVIDIA drivers for your platform.",
+    "Verify nvidia-smi is in PATH and executable.",
+)
+_NVIDIA_SMI_EXIT_REMEDIATION = (
+    "Install NVIDIA drivers for your platform.",
+    "Verify nvidia-smi is in PATH and functional.",
+)
+_NO_DEVICES_REMEDIATION = (
+    "Verify NVIDIA driver installation.",
+    "If running in container, enable GPU passthrough: docker run --gpus all ...",
+    "Check CUDA_VISIBLE_DEVICES and runtime constraints.",
+)
+_THROTTLE_REASON_ATTRS = (
+    ("gpu_idle", "nvmlClocksThrottleReasonGpuIdle"),
+    ("applications_clocks_setting", "nvmlClocksThrottleReasonApplicationsClocksSetting"),
+    ("sw_power_cap", "nvmlClocksThrottleReasonSwPowerCap"),
+    ("hw_slowdown", "nvmlClocksThrottleReasonHwSlowdown"),
+    ("sync_boost", "nvmlClocksThrottleReasonSyncBoost"),
+    ("sw_thermal_slowdown", "nvmlClocksThrottleReasonSwThermalSlowdown"),
+    ("hw_thermal_slowdown", "nvmlClocksThrottleReasonHwThermalSlowdown"),
+    ("hw_power_brake_slowdown", "nvmlClocksThrottleReasonHwPowerBrakeSlowdown"),
+)
 
 
 def _truncate_text(value: str | None, limit: int = _MAX_CAPTURE_LEN) -> str:
@@ -18,10 +70,6 @@ def _truncate_text(value: str | None, limit: int = _MAX_CAPTURE_LEN) -> str:
     return f"{text[:limit]}...<truncated>"
 
 
-def _is_linux_or_windows() -> bool:
-    return platform.system() in {"Linux", "Windows"}
-
-
 def _results(context: Context) -> dict[str, CheckResult]:
     payload = context.get("results")
     return payload if isinstance(payload, dict) else {}
@@ -36,6 +84,163 @@ def _facts(context: Context) -> dict[str, object]:
     return facts
 
 
+def _nvidia_smi_path(context: Context) -> str | None:
+    # PATH does not change during a doctor run, so walk it once and share the
+    # result between the checks that shell out to nvidia-smi.
+    facts = _facts(context)
+    if "_nvidia_smi_path" not in facts:
+        facts["_nvidia_smi_path"] = shutil.which("nvidia-smi")
+    path = facts["_nvidia_smi_path"]
+    return path if isinstance(path, str) else None
+
+
+def _nvidia_device_nodes() -> list[str]:
+    # A plain scandir prefix match; pathlib's glob builds a Path per entry and
+    # always walks the whole directory.
+    nodes: list[str] = []
+    try:
+        with os.scandir("/dev") as entries:
+            for entry in entries:
+                if entry.name.startswith("nvidia"):
+                    nodes.append(f"/dev/{entry.name}")
+                    if len(nodes) >= _MAX_DEVICE_NODES:
+                        break
+    except OSError:
+        return []
+    nodes.sort()
+    return nodes
+
+
+def _require_nvml(context: Context) -> ModuleType:
+    session = nvml_session(context)
+    if session.pynvml is None:
+        raise RuntimeError(session.init_error or session.import_error or "NVML is unavailable")
+    return session.pynvml
+
+
+def _nvml_handles(context: Context, pynvml: ModuleType) -> list[object]:
+    # Resolve every device handle once per session; the NVML checks all walk the
+    # same devices and only truncate what they report.
+    facts = _facts(context)
+    handles = facts.get("_nvml_handles")
+    if not isinstance(handles, list):
+        count = int(pynvml.nvmlDeviceGetCount())
+        handles = [pynvml.nvmlDeviceGetHandleByIndex(idx) for idx in range(count)]
+        facts["_nvml_device_count"] = count
+        facts["_nvml_handles"] = handles
+        # Handles are invalid once the session shuts down.
+        register_teardown(context, lambda: facts.pop("_nvml_handles", None))
+    return handles
+
+
+def _nvml_device_count(context: Context, pynvml: ModuleType) -> int:
+    _nvml_handles(context, pynvml)
+    count = _facts(context).get("_nvml_device_count")
+    return count if isinstance(count, int) else 0
+
+
+def _as_text(raw: object) -> str:
+    return raw.decode("utf-8", errors="replace") if isinstance(raw, bytes) else str(raw)
+
+
+def _nvml_device_listing(context: Context) -> str | None:
+    """Render ``nvidia-smi -L`` style output from the shared NVML session, if one is open."""
+    pynvml = nvml_session(context).pynvml
+    if pynvml is None:
+        return None
+    try:
+        lines = [
+            f"GPU {idx}: {_as_text(pynvml.nvmlDeviceGetName(handle))} "
+            f"(UUID: {_as_text(pynvml.nvmlDeviceGetUUID(handle))})"
+            for idx, handle in enumerate(_nvml_handles(context, pynvml))
+        ]
+    except Exception:  # noqa: BLE001
+        return None
+    # With no devices nvidia-smi exits non-zero; let the CLI report that.
+    return "\n".join(lines) if lines else None
+
+
+@cache
+def _throttle_flags(pynvml: ModuleType) -> tuple[tuple[str, int], ...]:
+    # The reason bits are constants of the bindings; drop the ones this
+    # pynvml version does not define so the device loop needs no guard.
+    flags = ((name, getattr(pynvml, attr, 0)) for name, attr in _THROTTLE_REASON_ATTRS)
+    return tuple((name, bit) for name, bit in flags if bit)
+
+
+@cache
+def _throttle_mask(pynvml: ModuleType) -> int:
+    return reduce(or_, (bit for _, bit in _throttle_flags(pynvml)), 0)
+
+
+def _nvml_query(pynvml: ModuleType, name: str, *args: object) -> int | Exception:
+    try:
+        return int(getattr(pynvml, name)(*args))
+    except Exception as exc:  # noqa: BLE001
+        return exc
+
+
+def _nvml_snapshot(context: Context, pynvml: ModuleType) -> list[dict[str, int | Exception]]:
+    """Walk the devices once and collect every scalar the NVML checks report on.
+
+    Failed queries are stored as the raised exception so each check can decide
+    whether its own field is fatal.
+    """
+    facts = _facts(context)
+    snapshot = facts.get("_nvml_snapshot")
+    if isinstance(snapshot, list):
+        return snapshot
+
+    sensor_gpu = getattr(pynvml, "NVML_TEMPERATURE_GPU", 0)
+    snapshot = [
+        {
+            "persistence": _nvml_query(pynvml, "nvmlDeviceGetPersistenceMode", handle),
+            "throttle_flags": _nvml_query(pynvml, "nvmlDeviceGetCurrentClocksThrottleReasons", handle),
+            "temperature_c": _nvml_query(pynvml, "nvmlDeviceGetTemperature", handle, sensor_gpu),
+            "power_mw": _nvml_query(pynvml, "nvmlDeviceGetPowerUsage", handle),
+        }
+        for handle in _nvml_handles(context, pynvml)
+    ]
+    facts["_nvml_snapshot"] = snapshot
+    return snapshot
+
+
+def _smi_number(value: str, kind: type[int] | type[float]) -> int | float | None:
+    # nvidia-smi prints "[N/A]" / "[Not Supported]" for fields a GPU lacks.
+    try:
+        return kind(value)
+    except ValueError:
+        return None
+
+
+def _smi_devices(context: Context, smi_path: str) -> list[dict[str, object]]:
+    """Enumerate GPUs with one ``nvidia-smi --query-gpu`` call when NVML bindings are missing."""
+    proc: subprocess.CompletedProcess[str] = run_cached(context, (smi_path, *_SMI_DEVICE_QUERY))
+    if proc.returncode != 0:
+        raise RuntimeError(_truncate_text(proc.stderr or proc.stdout) or f"nvidia-smi exited with {proc.returncode}")
+
+    devices: list[dict[str, object]] = []
+    for row in csv.reader(proc.stdout.splitlines(), skipinitialspace=True):
+        if len(row) < 6:
+            continue
+        index, name, persistence, temperature, power, throttle = (field.strip() for field in row[:6])
+        try:
+            throttle_flags: int | None = int(throttle, 16)
+        except ValueError:
+            throttle_flags = None
+        devices.append(
+            {
+                "index": _smi_number(index, int),
+                "name": name,
+                "persistence_mode": persistence.lower(),
+                "temperature_c": _smi_number(temperature, int),
+                "power_watts": _smi_number(power, float),
+                "throttle_flags": throttle_flags,
+            }
+        )
+    return devices
+
+
 @register_check
 class NvidiaSmiCheck(BaseCheck):
     id = "driver.nvidia_smi"
@@ -43,10 +248,10 @@ class NvidiaSmiCheck(BaseCheck):
     category = "driver"
 
     def should_run(self, context: Context) -> bool:
-        return _is_linux_or_windows()
+        return IS_LINUX_OR_WINDOWS
 
     def run(self, context: Context) -> CheckResult:
-        smi_path = shutil.which("nvidia-smi")
+        smi_path = _nvidia_smi_path(context)
         details = {
             "detection_method": "PATH lookup + nvidia-smi -L",
             "binary_path": smi_path,
@@ -60,71 +265,47 @@ class NvidiaSmiCheck(BaseCheck):
 
         if smi_path is None:
             details["stderr"] = "nvidia-smi not found in PATH."
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.FAIL,
                 message="nvidia-smi command not found.",
                 details=details,
-                remediation=[
-                    "Install NVIDIA drivers for your platform.",
-                    "Verify nvidia-smi is in PATH.",
-                ],
+                remediation=list(_NVIDIA_SMI_MISSING_REMEDIATION),
                 severity=3,
             )
 
+        # NVML answers the same question as nvidia-smi -L without a fork+exec
+        # and a second driver initialisation.
+        listing = _nvml_device_listing(context)
+        if listing is not None:
+            details["detection_method"] = "PATH lookup + NVML device list"
+            details["stdout"] = _truncate_text(listing)
+            facts["nvidia_smi_ok"] = True
+            return self._make_result(details=details, **_NVIDIA_SMI_OK)
+
         try:
-            proc = subprocess.run(
-                [smi_path, "-L"],
-                capture_output=True,
-                text=True,
-                timeout=15,
-                check=False,
-            )
+            proc: subprocess.CompletedProcess[str] = run_cached(context, (smi_path, "-L"))
             details["returncode"] = proc.returncode
             details["stdout"] = _truncate_text(proc.stdout)
             details["stderr"] = _truncate_text(proc.stderr)
         except Exception as exc:  # noqa: BLE001
             details["stderr"] = _truncate_text(str(exc))
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.FAIL,
                 message="Failed to execute nvidia-smi.",
                 details=details,
-                remediation=[
-                    "Install NVIDIA drivers for your platform.",
-                    "Verify nvidia-smi is in PATH and executable.",
-                ],
+                remediation=list(_NVIDIA_SMI_EXEC_REMEDIATION),
                 severity=3,
             )
 
         if proc.returncode == 0:
             facts["nvidia_smi_ok"] = True
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
-                status=Status.PASS,
-                message="nvidia-smi detected and operational.",
-                details=details,
-                remediation=None,
-                severity=0,
-            )
+            return self._make_result(details=details, **_NVIDIA_SMI_OK)
 
-        return CheckResult(
-            id=self.id,
-            title=self.title,
-            category=self.category,
+        return self._make_result(
             status=Status.FAIL,
             message="nvidia-smi returned a non-zero exit code.",
             details=details,
-            remediation=[
-                "Install NVIDIA drivers for your platform.",
-                "Verify nvidia-smi is in PATH and functional.",
-            ],
+            remediation=list(_NVIDIA_SMI_EXIT_REMEDIATION),
             severity=3,
         )
 
@@ -136,74 +317,49 @@ class NvmlAvailableCheck(BaseCheck):
     category = "gpu"
 
     def should_run(self, context: Context) -> bool:
-        return _is_linux_or_windows()
+        return IS_LINUX_OR_WINDOWS
 
     def run(self, context: Context) -> CheckResult:
         facts = _facts(context)
-        facts["nvml_ok"] = False
-
-        import_error: str | None = None
-        nvml_error: str | None = None
+        # The session stays open for the later NVML checks; the runner shuts
+        # it down once every check has finished.
+        session = nvml_session(context)
+        facts["nvml_ok"] = session.pynvml is not None
+        details = {
+            "import_error": session.import_error,
+            "nvml_error": session.init_error,
+        }
 
-        try:
-            import pynvml  # type: ignore[import-not-found]
-        except Exception as exc:  # noqa: BLE001
-            import_error = f"{type(exc).__name__}: {exc}"
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+        if session.import_error is not None:
+            return self._make_result(
                 status=Status.WARN,
                 message="pynvml is not available; NVML checks limited.",
-                details={
-                    "import_error": import_error,
-                    "nvml_error": nvml_error,
-                },
+                details=details,
                 remediation=[
                     "Install NVML bindings: pip install pynvml",
                 ],
                 severity=1,
             )
 
-        try:
-            pynvml.nvmlInit()
-            facts["nvml_ok"] = True
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
-                status=Status.PASS,
-                message="NVML initialized successfully.",
-                details={
-                    "import_error": import_error,
-                    "nvml_error": nvml_error,
-                },
-                remediation=None,
-                severity=0,
-            )
-        except Exception as exc:  # noqa: BLE001
-            nvml_error = f"{type(exc).__name__}: {exc}"
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+        if session.pynvml is None:
+            return self._make_result(
                 status=Status.FAIL,
                 message="NVML initialization failed.",
-                details={
-                    "import_error": import_error,
-                    "nvml_error": nvml_error,
-                },
+                details=details,
                 remediation=[
                     "Install/repair NVIDIA drivers and verify NVML is available.",
                     "Install NVML bindings: pip install pynvml",
                 ],
                 severity=3,
             )
-        finally:
-            try:
-                pynvml.nvmlShutdown()
-            except Exception:  # noqa: BLE001
-                pass
+
+        return self._make_result(
+            status=Status.PASS,
+            message="NVML initialized successfully.",
+            details=details,
+            remediation=None,
+            severity=0,
+        )
 
 
 @register_check
@@ -213,29 +369,38 @@ class NvmlDevicesCheck(BaseCheck):
     category = "gpu"
 
     def should_run(self, context: Context) -> bool:
-        if not _is_linux_or_windows():
+        if not IS_LINUX_OR_WINDOWS:
             return False
         nvml_result = _results(context).get("gpu.nvml_available")
-        return nvml_result is not None and nvml_result.status == Status.PASS
+        if nvml_result is None:
+            return False
+        # Without the pynvml bindings (WARN) nvidia-smi can still enumerate devices.
+        if nvml_result.status == Status.WARN:
+            return _nvidia_smi_path(context) is not None
+        return nvml_result.status == Status.PASS
 
     def run(self, context: Context) -> CheckResult:
         facts = _facts(context)
-        details = {
+        details: dict[str, object] = {
             "gpu_count": 0,
             "gpu_names": [],
         }
 
         try:
-            import pynvml  # type: ignore[import-not-found]
-
-            pynvml.nvmlInit()
-            count = int(pynvml.nvmlDeviceGetCount())
-            names: list[str] = []
-
-            for idx in range(min(count, 8)):
-                handle = pynvml.nvmlDeviceGetHandleByIndex(idx)
-                raw_name = pynvml.nvmlDeviceGetName(handle)
-                names.append(raw_name.decode("utf-8", errors="replace") if isinstance(raw_name, bytes) else str(raw_name))
+            smi_path = _nvidia_smi_path(context)
+            if nvml_session(context).import_error is not None and smi_path is not None:
+                source = "nvidia-smi"
+                devices = _smi_devices(context, smi_path)
+                count = len(devices)
+                names = [str(device["name"]) for device in devices[:_MAX_DEVICES]]
+                details["source"] = source
+                details["devices"] = devices[:_MAX_DEVICES]
+            else:
+                source = "NVML"
+                pynvml = _require_nvml(context)
+                handles = _nvml_handles(context, pynvml)
+                count = _nvml_device_count(context, pynvml)
+                names = [_as_text(pynvml.nvmlDeviceGetName(handle)) for handle in handles[:_MAX_DEVICES]]
 
             details["gpu_count"] = count
             details["gpu_names"] = names
@@ -244,55 +409,31 @@ class NvmlDevicesCheck(BaseCheck):
             facts["gpu_names"] = names
 
             if count > 0:
-                return CheckResult(
-                    id=self.id,
-                    title=self.title,
-                    category=self.category,
+                return self._make_result(
                     status=Status.PASS,
-                    message=f"Detected {count} GPU device(s) via NVML.",
+                    message=f"Detected {count} GPU device(s) via {source}.",
                     details=details,
                     remediation=None,
                     severity=0,
                 )
 
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.FAIL,
                 message="NVML initialized but no GPU devices were found.",
                 details=details,
-                remediation=[
-                    "Verify NVIDIA driver installation.",
-                    "If running in container, enable GPU passthrough: docker run --gpus all ...",
-                    "Check CUDA_VISIBLE_DEVICES and runtime constraints.",
-                ],
+                remediation=list(_NO_DEVICES_REMEDIATION),
                 severity=3,
             )
         except Exception as exc:  # noqa: BLE001
             details["nvml_error"] = f"{type(exc).__name__}: {exc}"
             facts["gpu_count"] = 0
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.FAIL,
                 message="Failed to enumerate GPU devices with NVML.",
                 details=details,
-                remediation=[
-                    "Verify NVIDIA driver installation.",
-                    "If running in container, enable GPU passthrough: docker run --gpus all ...",
-                    "Check CUDA_VISIBLE_DEVICES and runtime constraints.",
-                ],
+                remediation=list(_NO_DEVICES_REMEDIATION),
                 severity=3,
             )
-        finally:
-            try:
-                import pynvml  # type: ignore[import-not-found]
-
-                pynvml.nvmlShutdown()
-            except Exception:  # noqa: BLE001
-                pass
 
 
 @register_check
@@ -302,23 +443,19 @@ class RuntimeGpuPassthroughCheck(BaseCheck):
     category = "integration"
 
     def should_run(self, context: Context) -> bool:
-        return platform.system() == "Linux" and bool(context.get("is_container"))
+        return IS_LINUX and bool(context.get("is_container"))
 
     def run(self, context: Context) -> CheckResult:
-        device_nodes = sorted(str(path) for path in Path("/dev").glob("nvidia*"))
+        device_nodes = _nvidia_device_nodes()
 
-        smi_path = shutil.which("nvidia-smi")
         returncode: int | None = None
         stderr = ""
+        # Either signal proves visibility, so only spawn nvidia-smi when no
+        # device node is present.
+        smi_path = None if device_nodes else _nvidia_smi_path(context)
         if smi_path is not None:
             try:
-                proc = subprocess.run(
-                    [smi_path, "-L"],
-                    capture_output=True,
-                    text=True,
-                    timeout=15,
-                    check=False,
-                )
+                proc: subprocess.CompletedProcess[str] = run_cached(context, (smi_path, "-L"))
                 returncode = proc.returncode
                 stderr = _truncate_text(proc.stderr)
             except Exception as exc:  # noqa: BLE001
@@ -332,10 +469,7 @@ class RuntimeGpuPassthroughCheck(BaseCheck):
         }
 
         if visible:
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.PASS,
                 message="Container has visible GPU devices.",
                 details=details,
@@ -343,10 +477,7 @@ class RuntimeGpuPassthroughCheck(BaseCheck):
                 severity=0,
             )
 
-        return CheckResult(
-            id=self.id,
-            title=self.title,
-            category=self.category,
+        return self._make_result(
             status=Status.FAIL,
             message="Container detected but GPU devices are not visible.",
             details=details,
@@ -367,35 +498,30 @@ class GpuPersistenceModeCheck(BaseCheck):
 
     def should_run(self, context: Context) -> bool:
         nvml_result = _results(context).get("gpu.nvml_available")
-        return platform.system() == "Linux" and nvml_result is not None and nvml_result.status == Status.PASS
+        return IS_LINUX and nvml_result is not None and nvml_result.status == Status.PASS
 
     def run(self, context: Context) -> CheckResult:
         try:
-            import pynvml  # type: ignore[import-not-found]
-
-            pynvml.nvmlInit()
-            count = int(pynvml.nvmlDeviceGetCount())
+            pynvml = _require_nvml(context)
             modes: list[dict[str, object]] = []
             off_indices: list[int] = []
 
-            for idx in range(count):
-                handle = pynvml.nvmlDeviceGetHandleByIndex(idx)
-                mode_raw = int(pynvml.nvmlDeviceGetPersistenceMode(handle))
+            for idx, device in enumerate(_nvml_snapshot(context, pynvml)):
+                mode_raw = device["persistence"]
+                if isinstance(mode_raw, Exception):
+                    raise mode_raw
                 mode_enabled = mode_raw == 1
                 modes.append({"index": idx, "enabled": mode_enabled})
                 if not mode_enabled:
                     off_indices.append(idx)
 
             details = {
-                "persistence_modes": modes[:8],
+                "persistence_modes": modes[:_MAX_DEVICES],
                 "off_gpu_indices": off_indices[:16],
             }
 
             if off_indices:
-                return CheckResult(
-                    id=self.id,
-                    title=self.title,
-                    category=self.category,
+                return self._make_result(
                     status=Status.WARN,
                     message="Persistence mode is disabled on one or more GPUs.",
                     details=details,
@@ -405,10 +531,7 @@ class GpuPersistenceModeCheck(BaseCheck):
                     severity=1,
                 )
 
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.PASS,
                 message="Persistence mode is enabled on detected GPUs.",
                 details=details,
@@ -416,10 +539,7 @@ class GpuPersistenceModeCheck(BaseCheck):
                 severity=0,
             )
         except Exception as exc:  # noqa: BLE001
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.WARN,
                 message="Could not read GPU persistence mode via NVML.",
                 details={"nvml_error": f"{type(exc).__name__}: {exc}"},
@@ -428,13 +548,6 @@ class GpuPersistenceModeCheck(BaseCheck):
                 ],
                 severity=1,
             )
-        finally:
-            try:
-                import pynvml  # type: ignore[import-not-found]
-
-                pynvml.nvmlShutdown()
-            except Exception:  # noqa: BLE001
-                pass
 
 
 @register_check
@@ -445,48 +558,32 @@ class GpuClockThrottleReasonsCheck(BaseCheck):
 
     def should_run(self, context: Context) -> bool:
         nvml_result = _results(context).get("gpu.nvml_available")
-        return platform.system() == "Linux" and nvml_result is not None and nvml_result.status == Status.PASS
+        return IS_LINUX and nvml_result is not None and nvml_result.status == Status.PASS
 
     def run(self, context: Context) -> CheckResult:
         try:
-            import pynvml  # type: ignore[import-not-found]
-
-            pynvml.nvmlInit()
-            count = int(pynvml.nvmlDeviceGetCount())
+            pynvml = _require_nvml(context)
             throttle_reasons: list[dict[str, object]] = []
             throttling_detected = False
 
-            known_flags = {
-                "gpu_idle": getattr(pynvml, "nvmlClocksThrottleReasonGpuIdle", 0),
-                "applications_clocks_setting": getattr(pynvml, "nvmlClocksThrottleReasonApplicationsClocksSetting", 0),
-                "sw_power_cap": getattr(pynvml, "nvmlClocksThrottleReasonSwPowerCap", 0),
-                "hw_slowdown": getattr(pynvml, "nvmlClocksThrottleReasonHwSlowdown", 0),
-                "sync_boost": getattr(pynvml, "nvmlClocksThrottleReasonSyncBoost", 0),
-                "sw_thermal_slowdown": getattr(pynvml, "nvmlClocksThrottleReasonSwThermalSlowdown", 0),
-                "hw_thermal_slowdown": getattr(pynvml, "nvmlClocksThrottleReasonHwThermalSlowdown", 0),
-                "hw_power_brake_slowdown": getattr(pynvml, "nvmlClocksThrottleReasonHwPowerBrakeSlowdown", 0),
-            }
+            known_flags = _throttle_flags(pynvml)
+            known_mask = _throttle_mask(pynvml)
             no_throttle_flag = getattr(pynvml, "nvmlClocksThrottleReasonNone", 0)
 
-            for idx in range(count):
-                handle = pynvml.nvmlDeviceGetHandleByIndex(idx)
-                flags = int(pynvml.nvmlDeviceGetCurrentClocksThrottleReasons(handle))
-                reason_names = [name for name, bit in known_flags.items() if bit and (flags & bit)]
+            for idx, device in enumerate(_nvml_snapshot(context, pynvml)):
+                flags = device["throttle_flags"]
+                if isinstance(flags, Exception):
+                    raise flags
+                # Idle GPUs report no known bits; one AND skips the per-reason scan.
+                masked = flags & known_mask
+                reason_names = [name for name, bit in known_flags if masked & bit] if masked else []
                 if flags != no_throttle_flag and reason_names:
                     throttling_detected = True
 
-                temperature_c = None
-                power_watts = None
-                try:
-                    sensor_gpu = getattr(pynvml, "NVML_TEMPERATURE_GPU", 0)
-                    temperature_c = int(pynvml.nvmlDeviceGetTemperature(handle, sensor_gpu))
-                except Exception:  # noqa: BLE001
-                    temperature_c = None
-                try:
-                    power_mw = int(pynvml.nvmlDeviceGetPowerUsage(handle))
-                    power_watts = round(power_mw / 1000.0, 2)
-                except Exception:  # noqa: BLE001
-                    power_watts = None
+                temperature = device["temperature_c"]
+                power_mw = device["power_mw"]
+                temperature_c = None if isinstance(temperature, Exception) else temperature
+                power_watts = None if isinstance(power_mw, Exception) else round(power_mw / 1000.0, 2)
 
                 throttle_reasons.append(
                     {
@@ -498,13 +595,10 @@ class GpuClockThrottleReasonsCheck(BaseCheck):
                     }
                 )
 
-            details = {"devices": throttle_reasons[:8]}
+            details = {"devices": throttle_reasons[:_MAX_DEVICES]}
 
             if throttling_detected:
-                return CheckResult(
-                    id=self.id,
-                    title=self.title,
-                    category=self.category,
+                return self._make_result(
                     status=Status.WARN,
                     message="One or more GPUs are currently clock-throttled.",
                     details=details,
@@ -515,10 +609,7 @@ class GpuClockThrottleReasonsCheck(BaseCheck):
                     severity=1,
                 )
 
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.PASS,
                 message="No active GPU clock throttling reasons detected.",
                 details=details,
@@ -526,10 +617,7 @@ class GpuClockThrottleReasonsCheck(BaseCheck):
                 severity=0,
             )
         except Exception as exc:  # noqa: BLE001
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.WARN,
                 message="Could not read GPU throttle reasons via NVML.",
                 details={"nvml_error": f"{type(exc).__name__}: {exc}"},
@@ -538,13 +626,6 @@ class GpuClockThrottleReasonsCheck(BaseCheck):
                 ],
                 severity=1,
             )
-        finally:
-            try:
-                import pynvml  # type: ignore[import-not-found]
-
-                pynvml.nvmlShutdown()
-            except Exception:  # noqa: BLE001
-                pass
 
 
 __all__ = [
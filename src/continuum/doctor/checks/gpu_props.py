@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Any
+
 from continuum.doctor.checks.base import BaseCheck, Context, register_check
 from continuum.doctor.models import CheckResult, Status
+from continuum.doctor.utils.torch_loader import load_torch
 
 
 def _results(context: Context) -> dict[str, CheckResult]:
@@ -9,6 +13,14 @@ def _results(context: Context) -> dict[str, CheckResult]:
     return payload if isinstance(payload, dict) else {}
 
 
+@lru_cache(maxsize=16)
+def _device_props(cuda: Any, index: int) -> Any:
+    # Properties are fixed once CUDA has initialised, so repeat doctor runs in
+    # the same process (e.g. watch mode) reuse them. Keying on the torch.cuda
+    # module keeps entries from different torch instances apart.
+    return cuda.get_device_properties(index)
+
+
 @register_check
 class GpuDevicePropertiesCheck(BaseCheck):
     id = "gpu.device_properties"
@@ -21,12 +33,9 @@ class GpuDevicePropertiesCheck(BaseCheck):
 
     def run(self, context: Context) -> CheckResult:
         try:
-            import torch  # type: ignore[import-not-found]
+            torch = load_torch()
         except Exception as exc:  # noqa: BLE001
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.FAIL,
                 message="PyTorch import failed while collecting GPU properties.",
                 details={"import_error": f"{type(exc).__name__}: {exc}"},
@@ -37,10 +46,7 @@ class GpuDevicePropertiesCheck(BaseCheck):
             )
 
         if not bool(torch.cuda.is_available()):
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.SKIP,
                 message="torch.cuda is not available; skipping GPU property collection.",
                 details={"cuda_available": False},
@@ -54,27 +60,24 @@ class GpuDevicePropertiesCheck(BaseCheck):
         low_cc: list[dict[str, object]] = []
 
         for idx in range(min(device_count, 8)):
-            props = torch.cuda.get_device_properties(idx)
+            props = _device_props(torch.cuda, idx)
             major = int(getattr(props, "major", 0))
             minor = int(getattr(props, "minor", 0))
-            cc = float(f"{major}.{minor}")
             item = {
                 "index": idx,
                 "name": str(getattr(props, "name", f"GPU-{idx}")),
-                "compute_capability": cc,
+                # A string, since 8.10 and 8.1 are different capabilities.
+                "compute_capability": f"{major}.{minor}",
                 "total_memory": int(getattr(props, "total_memory", 0)),
                 "multiprocessor_count": int(getattr(props, "multi_processor_count", 0)),
             }
             device_props.append(item)
-            if cc < 7.0:
+            if (major, minor) < (7, 0):
                 low_cc.append(item)
 
         details = {"device_count": device_count, "devices": device_props}
         if low_cc:
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.WARN,
                 message="Detected GPU(s) with compute capability below 7.0.",
                 details=details,
@@ -85,10 +88,7 @@ class GpuDevicePropertiesCheck(BaseCheck):
                 severity=1,
             )
 
-        return CheckResult(
-            id=self.id,
-            title=self.title,
-            category=self.category,
+        return self._make_result(
             status=Status.PASS,
             message="Collected GPU device properties.",
             details=details,
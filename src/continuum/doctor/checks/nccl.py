@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import os
-import platform
 
-from continuum.doctor.checks.base import BaseCheck, Context, register_check
+from continuum.doctor.checks.base import IS_LINUX, SYSTEM, BaseCheck, Context, register_check
 from continuum.doctor.models import CheckResult, Status
 
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
 
 def _results(context: Context) -> dict[str, CheckResult]:
     payload = context.get("results")
@@ -28,7 +29,7 @@ class NcclEnvConfigCheck(BaseCheck):
     category = "nccl"
 
     def should_run(self, context: Context) -> bool:
-        if platform.system() != "Linux":
+        if not IS_LINUX:
             return False
         facts = _facts(context)
         gpu_count = facts.get("gpu_count")
@@ -38,14 +39,17 @@ class NcclEnvConfigCheck(BaseCheck):
     def run(self, context: Context) -> CheckResult:
         facts = _facts(context)
         gpu_count = facts.get("gpu_count", 0)
-        p2p_disable = os.environ.get("NCCL_P2P_DISABLE")
-        ib_disable = os.environ.get("NCCL_IB_DISABLE")
-        socket_ifname = os.environ.get("NCCL_SOCKET_IFNAME")
+        # Bind the mapping's getter once; the NCCL vars are read in one pass.
+        env_get = os.environ.get
+        p2p_disable = env_get("NCCL_P2P_DISABLE")
+        ib_disable = env_get("NCCL_IB_DISABLE")
+        socket_ifname = env_get("NCCL_SOCKET_IFNAME")
 
         suspicious: list[str] = []
-        if isinstance(gpu_count, int) and gpu_count > 1 and str(p2p_disable).lower() in {"1", "true", "yes"}:
+        multi_gpu = isinstance(gpu_count, int) and gpu_count > 1
+        if multi_gpu and p2p_disable and p2p_disable.lower() in _TRUTHY:
             suspicious.append("NCCL_P2P_DISABLE disables direct GPU P2P on multi-GPU setup.")
-        if isinstance(gpu_count, int) and gpu_count > 1 and str(ib_disable).lower() in {"1", "true", "yes"}:
+        if multi_gpu and ib_disable and ib_disable.lower() in _TRUTHY:
             suspicious.append("NCCL_IB_DISABLE disables InfiniBand transport.")
         if socket_ifname in {"lo", "docker0"}:
             suspicious.append("NCCL_SOCKET_IFNAME is set to loopback/docker interface.")
@@ -60,10 +64,7 @@ class NcclEnvConfigCheck(BaseCheck):
         }
 
         if suspicious:
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.WARN,
                 message="Potentially problematic NCCL environment settings detected.",
                 details=details,
@@ -75,10 +76,7 @@ class NcclEnvConfigCheck(BaseCheck):
                 severity=1,
             )
 
-        return CheckResult(
-            id=self.id,
-            title=self.title,
-            category=self.category,
+        return self._make_result(
             status=Status.PASS,
             message="No obvious NCCL environment misconfiguration detected.",
             details=details,
@@ -98,14 +96,11 @@ class NcclTorchBackendCheck(BaseCheck):
         return installed is not None and installed.status == Status.PASS
 
     def run(self, context: Context) -> CheckResult:
-        if platform.system() != "Linux":
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+        if not IS_LINUX:
+            return self._make_result(
                 status=Status.SKIP,
                 message="NCCL backend checks are Linux-only.",
-                details={"platform": platform.system()},
+                details={"platform": SYSTEM},
                 remediation=None,
                 severity=0,
                 duration_ms=0.0,
@@ -114,6 +109,16 @@ class NcclTorchBackendCheck(BaseCheck):
         facts = _facts(context)
         gpu_count = facts.get("gpu_count", 0)
         multi_gpu = isinstance(gpu_count, int) and gpu_count > 1
+        if not multi_gpu:
+            # Only the multi-GPU case can warn, so don't pay for importing
+            # torch.distributed (and its NCCL/Gloo bindings) otherwise.
+            return self._make_result(
+                status=Status.PASS,
+                message="Single GPU or no GPU detected; NCCL backend not required.",
+                details={"gpu_count": gpu_count, "skipped_reason": "single-gpu"},
+                remediation=None,
+                severity=0,
+            )
 
         dist_available = False
         nccl_available = False
@@ -135,10 +140,7 @@ class NcclTorchBackendCheck(BaseCheck):
         }
 
         if multi_gpu and not nccl_available:
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.WARN,
                 message="Multi-GPU environment detected but NCCL backend is unavailable.",
                 details=details,
@@ -149,10 +151,7 @@ class NcclTorchBackendCheck(BaseCheck):
                 severity=1,
             )
 
-        return CheckResult(
-            id=self.id,
-            title=self.title,
-            category=self.category,
+        return self._make_result(
             status=Status.PASS,
             message="Torch distributed/NCCL backend check completed.",
             details=details,
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import importlib.util
+import sys
+from dataclasses import dataclass, replace
+from types import ModuleType
 
 from continuum.doctor.checks.base import BaseCheck, Context, register_check
 from continuum.doctor.models import CheckResult, Status
+from continuum.doctor.utils.torch_loader import load_torch
 
 
 def _results(context: Context) -> dict[str, CheckResult]:
@@ -26,6 +30,88 @@ def _gpu_count(context: Context) -> int:
     return value if isinstance(value, int) else 0
 
 
+@dataclass(frozen=True, slots=True)
+class _TorchProbe:
+    installed: bool
+    origin: str | None
+    import_error: str | None = None
+    version: str = "unknown"
+    cuda_version: str | None = None
+    cudnn_version: int | None = None
+    # Filled in by _probe_torch_cuda; None until a CUDA check asks for it.
+    cuda_available: bool | None = None
+    cuda_error: str | None = None
+
+
+def _torch_module(context: Context) -> ModuleType | None:
+    facts = _facts(context)
+    if "_torch" not in facts:
+        try:
+            facts["_torch"] = load_torch()
+        except Exception as exc:  # noqa: BLE001
+            facts["_torch"] = None
+            facts["_torch_import_error"] = f"{type(exc).__name__}: {exc}"
+    return facts["_torch"]  # type: ignore[return-value]
+
+
+def _probe_torch(context: Context) -> _TorchProbe:
+    facts = _facts(context)
+    probe = facts.get("torch_probe")
+    if isinstance(probe, _TorchProbe):
+        return probe
+
+    loaded = sys.modules.get("torch")
+    if loaded is not None:
+        # Already imported in this process: skip the finder walk and reuse the module.
+        installed = True
+        origin = getattr(loaded, "__file__", None)
+        facts.setdefault("_torch", loaded)
+    else:
+        spec = importlib.util.find_spec("torch")
+        installed = spec is not None
+        origin = getattr(spec, "origin", None) if installed else None
+    torch = _torch_module(context) if installed else None
+    if torch is None:
+        probe = _TorchProbe(
+            installed=installed,
+            origin=origin,
+            import_error=str(facts.get("_torch_import_error", "torch is not installed")),
+        )
+    else:
+        cudnn_version: int | None = None
+        try:
+            cudnn_api = getattr(getattr(torch, "backends", None), "cudnn", None)
+            if cudnn_api is not None and hasattr(cudnn_api, "version"):
+                cudnn_version = cudnn_api.version()
+        except Exception:  # noqa: BLE001
+            cudnn_version = None
+        probe = _TorchProbe(
+            installed=installed,
+            origin=origin,
+            version=str(getattr(torch, "__version__", "unknown")),
+            cuda_version=getattr(getattr(torch, "version", None), "cuda", None),
+            cudnn_version=cudnn_version,
+        )
+
+    facts["torch_probe"] = probe
+    return probe
+
+
+def _probe_torch_cuda(context: Context) -> _TorchProbe:
+    # CUDA initialisation can fail or hang independently of the import, so only
+    # the checks that report on it pay for torch.cuda.is_available().
+    probe = _probe_torch(context)
+    torch = _facts(context).get("_torch")
+    if probe.cuda_available is not None or torch is None:
+        return probe
+    try:
+        probe = replace(probe, cuda_available=bool(torch.cuda.is_available()))
+    except Exception as exc:  # noqa: BLE001
+        probe = replace(probe, cuda_available=False, cuda_error=f"{type(exc).__name__}: {exc}")
+    _facts(context)["torch_probe"] = probe
+    return probe
+
+
 @register_check
 class PytorchInstalledCheck(BaseCheck):
     id = "pytorch.installed"
@@ -33,17 +119,14 @@ class PytorchInstalledCheck(BaseCheck):
     category = "pytorch"
 
     def run(self, context: Context) -> CheckResult:
-        spec = importlib.util.find_spec("torch")
-        found = spec is not None
-        origin = getattr(spec, "origin", None) if found else None
+        probe = _probe_torch(context)
+        found = probe.installed
+        origin = probe.origin
 
         _facts(context)["torch_installed"] = found
 
         if found:
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.PASS,
                 message="PyTorch package detected.",
                 details={"found": found, "origin": origin},
@@ -51,10 +134,7 @@ class PytorchInstalledCheck(BaseCheck):
                 severity=0,
             )
 
-        return CheckResult(
-            id=self.id,
-            title=self.title,
-            category=self.category,
+        return self._make_result(
             status=Status.FAIL,
             message="PyTorch package is not installed.",
             details={"found": found, "origin": origin},
@@ -76,16 +156,12 @@ class PytorchCudaAvailableCheck(BaseCheck):
         return installed is not None and installed.status == Status.PASS
 
     def run(self, context: Context) -> CheckResult:
-        try:
-            import torch  # type: ignore[import-not-found]
-        except Exception as exc:  # noqa: BLE001
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+        probe = _probe_torch_cuda(context)
+        if probe.import_error is not None:
+            return self._make_result(
                 status=Status.FAIL,
                 message="PyTorch import failed.",
-                details={"import_error": f"{type(exc).__name__}: {exc}"},
+                details={"import_error": probe.import_error},
                 remediation=[
                     "Reinstall PyTorch in the active environment.",
                     "Verify python/venv activation and package compatibility.",
@@ -93,9 +169,9 @@ class PytorchCudaAvailableCheck(BaseCheck):
                 severity=3,
             )
 
-        torch_version = str(getattr(torch, "__version__", "unknown"))
-        torch_cuda_version = getattr(getattr(torch, "version", None), "cuda", None)
-        cuda_available = bool(torch.cuda.is_available())
+        torch_version = probe.version
+        torch_cuda_version = probe.cuda_version
+        cuda_available = bool(probe.cuda_available)
         gpu_count = _gpu_count(context)
         gpu_present = gpu_count > 0
         cpu_build = (torch_cuda_version is None) or ("+cpu" in torch_version.lower())
@@ -108,11 +184,20 @@ class PytorchCudaAvailableCheck(BaseCheck):
             "gpu_count": gpu_count,
         }
 
+        if probe.cuda_error is not None:
+            details["cuda_error"] = probe.cuda_error
+            return self._make_result(
+                status=Status.FAIL,
+                message="torch.cuda.is_available() raised an error.",
+                details=details,
+                remediation=[
+                    "Verify driver, CUDA runtime, and PyTorch build compatibility.",
+                ],
+                severity=3,
+            )
+
         if cuda_available:
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.PASS,
                 message="torch.cuda.is_available() is True.",
                 details=details,
@@ -121,10 +206,7 @@ class PytorchCudaAvailableCheck(BaseCheck):
             )
 
         if gpu_present:
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.FAIL,
                 message="GPU detected but torch.cuda.is_available() is False.",
                 details=details,
@@ -136,10 +218,7 @@ class PytorchCudaAvailableCheck(BaseCheck):
             )
 
         if cpu_build:
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.WARN,
                 message="PyTorch appears to be CPU-only; CUDA is unavailable.",
                 details=details,
@@ -149,10 +228,7 @@ class PytorchCudaAvailableCheck(BaseCheck):
                 severity=1,
             )
 
-        return CheckResult(
-            id=self.id,
-            title=self.title,
-            category=self.category,
+        return self._make_result(
             status=Status.WARN,
             message="CUDA is unavailable in the current PyTorch runtime.",
             details=details,
@@ -174,32 +250,21 @@ class PytorchCudaVersionCheck(BaseCheck):
         return installed is not None and installed.status == Status.PASS
 
     def run(self, context: Context) -> CheckResult:
-        try:
-            import torch  # type: ignore[import-not-found]
-        except Exception as exc:  # noqa: BLE001
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+        probe = _probe_torch(context)
+        if probe.import_error is not None:
+            return self._make_result(
                 status=Status.FAIL,
                 message="PyTorch import failed while querying CUDA version.",
-                details={"import_error": f"{type(exc).__name__}: {exc}"},
+                details={"import_error": probe.import_error},
                 remediation=[
                     "Reinstall PyTorch in the active environment.",
                 ],
                 severity=3,
             )
 
-        torch_version = str(getattr(torch, "__version__", "unknown"))
-        torch_cuda_version = getattr(getattr(torch, "version", None), "cuda", None)
-
-        cudnn_version: int | None = None
-        try:
-            cudnn_api = getattr(getattr(torch, "backends", None), "cudnn", None)
-            if cudnn_api is not None and hasattr(cudnn_api, "version"):
-                cudnn_version = cudnn_api.version()
-        except Exception:  # noqa: BLE001
-            cudnn_version = None
+        torch_version = probe.version
+        torch_cuda_version = probe.cuda_version
+        cudnn_version = probe.cudnn_version
 
         gpu_count = _gpu_count(context)
         details = {
@@ -210,10 +275,7 @@ class PytorchCudaVersionCheck(BaseCheck):
         }
 
         if torch_cuda_version is None and gpu_count > 0:
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.WARN,
                 message="GPU detected but PyTorch reports no CUDA version.",
                 details=details,
@@ -223,10 +285,7 @@ class PytorchCudaVersionCheck(BaseCheck):
                 severity=1,
             )
 
-        return CheckResult(
-            id=self.id,
-            title=self.title,
-            category=self.category,
+        return self._make_result(
             status=Status.PASS,
             message="PyTorch CUDA version metadata collected.",
             details=details,
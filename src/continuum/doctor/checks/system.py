@@ -7,6 +7,7 @@ from continuum.doctor.checks.base import BaseCheck, Context, register_check
 from continuum.doctor.models import CheckResult, Status
 
 _GIB = 1024**3
+_GIB_8 = 8 * _GIB
 
 
 @register_check
@@ -23,10 +24,7 @@ class DevShmCheck(BaseCheck):
             stat = os.statvfs("/dev/shm")
             total_bytes = int(stat.f_frsize * stat.f_blocks)
         except OSError as exc:
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.FAIL,
                 message="Unable to read /dev/shm capacity.",
                 details={"error": f"{type(exc).__name__}: {exc}"},
@@ -37,17 +35,22 @@ class DevShmCheck(BaseCheck):
                 severity=3,
             )
 
-        total_gib = total_bytes / _GIB
         details = {
             "total_bytes": total_bytes,
-            "total_gib": round(total_gib, 3),
+            "total_gib": round(total_bytes / _GIB, 3),
         }
 
+        if total_bytes >= _GIB_8:
+            return self._make_result(
+                status=Status.PASS,
+                message="/dev/shm size is within recommended range.",
+                details=details,
+                remediation=None,
+                severity=0,
+            )
+
         if total_bytes < _GIB:
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
+            return self._make_result(
                 status=Status.FAIL,
                 message="/dev/shm is below 1 GiB.",
                 details=details,
@@ -58,30 +61,15 @@ class DevShmCheck(BaseCheck):
                 severity=3,
             )
 
-        if total_bytes < 8 * _GIB:
-            return CheckResult(
-                id=self.id,
-                title=self.title,
-                category=self.category,
-                status=Status.WARN,
-                message="/dev/shm is below recommended 8 GiB.",
-                details=details,
-                remediation=[
-                    "Increase shared memory size (example: docker run --shm-size=8g ...).",
-                    "Use tmpfs mount for /dev/shm when needed.",
-                ],
-                severity=1,
-            )
-
-        return CheckResult(
-            id=self.id,
-            title=self.title,
-            category=self.category,
-            status=Status.PASS,
-            message="/dev/shm size is within recommended range.",
+        return self._make_result(
+            status=Status.WARN,
+            message="/dev/shm is below recommended 8 GiB.",
             details=details,
-            remediation=None,
-            severity=0,
+            remediation=[
+                "Increase shared memory size (example: docker run --shm-size=8g ...).",
+                "Use tmpfs mount for /dev/shm when needed.",
+            ],
+            severity=1,
         )
 
 
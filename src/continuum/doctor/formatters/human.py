@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from rich.console import Console
-from rich.table import Table
+from typing import TYPE_CHECKING
 
 from continuum.doctor.models import Report
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 _STATUS_STYLE = {
     "PASS": "green",
     "WARN": "yellow",
@@ -15,6 +17,10 @@ _STATUS_STYLE = {
 
 
 def render_report_human(report: Report, console: Console | None = None) -> None:
+    # Deferred so --list-checks and other non-rendering paths never import rich.
+    from rich.console import Console
+    from rich.table import Table
+
     active_console = console or Console()
 
     table = Table(title="Continuum Doctor Report")
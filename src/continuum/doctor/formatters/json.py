@@ -5,6 +5,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 from continuum.doctor.models import Report
 
 
@@ -12,17 +17,38 @@ def report_to_dict(report: Report) -> dict[str, Any]:
     return report.to_dict()
 
 
+def _orjson_dumps(payload: dict[str, Any]) -> bytes | None:
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # orjson rejects some payloads stdlib json accepts (huge ints, subclassed keys).
+        return None
+
+
+def report_to_json(report: Report) -> str:
+    payload = report_to_dict(report)
+    encoded = _orjson_dumps(payload)
+    if encoded is not None:
+        return encoded.decode("utf-8")
+    return json.dumps(payload, indent=2, ensure_ascii=False)
+
+
 def write_report_json(report: Report, output_dir: Path) -> Path:
     output_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_path = output_dir / f"doctor_{timestamp}.json"
 
     payload = report_to_dict(report)
-    output_path.write_text(
-        json.dumps(payload, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    encoded = _orjson_dumps(payload)
+    if encoded is not None:
+        output_path.write_bytes(encoded + b"\n")
+        return output_path
+    with output_path.open("w", encoding="utf-8", newline="\n") as handle:
+        json.dump(payload, handle, indent=2, ensure_ascii=False)
+        handle.write("\n")
     return output_path
 
 
-__all__ = ["report_to_dict", "write_report_json"]
+__all__ = ["report_to_dict", "report_to_json", "write_report_json"]
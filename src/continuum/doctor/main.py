@@ -1,25 +1,33 @@
 from __future__ import annotations
 
-import json
-from importlib.metadata import PackageNotFoundError, version
+from functools import lru_cache
 from pathlib import Path
 
 import typer
 
-# Import registers built-in checks via decorators.
-from continuum.doctor.checks import cuda as _cuda_checks  # noqa: F401
-from continuum.doctor.checks import environment as _environment_checks  # noqa: F401
-from continuum.doctor.checks import gpu as _gpu_checks  # noqa: F401
-from continuum.doctor.checks import gpu_props as _gpu_props_checks  # noqa: F401
-from continuum.doctor.checks import nccl as _nccl_checks  # noqa: F401
-from continuum.doctor.checks import pytorch as _pytorch_checks  # noqa: F401
-from continuum.doctor.checks import system as _system_checks  # noqa: F401
 from continuum.doctor.formatters.human import render_report_human
-from continuum.doctor.formatters.json import report_to_dict, write_report_json
+from continuum.doctor.formatters.json import report_to_json, write_report_json
 from continuum.doctor.runner import DoctorRunner
 
 
+@lru_cache(maxsize=1)
+def _register_builtin_checks() -> None:
+    # Import registers built-in checks via decorators; deferred so other
+    # `continuum` subcommands and --help do not load the check modules.
+    from continuum.doctor.checks import cuda as _cuda_checks  # noqa: F401
+    from continuum.doctor.checks import environment as _environment_checks  # noqa: F401
+    from continuum.doctor.checks import gpu as _gpu_checks  # noqa: F401
+    from continuum.doctor.checks import gpu_props as _gpu_props_checks  # noqa: F401
+    from continuum.doctor.checks import nccl as _nccl_checks  # noqa: F401
+    from continuum.doctor.checks import pytorch as _pytorch_checks  # noqa: F401
+    from continuum.doctor.checks import system as _system_checks  # noqa: F401
+
+
 def _resolve_hydra_version() -> str:
+    # importlib.metadata pulls in the email package; only pay for it when the
+    # doctor command actually runs, not on every `continuum` startup.
+    from importlib.metadata import PackageNotFoundError, version
+
     for dist_name in ("continuum-intelligence", "continuum"):
         try:
             return version(dist_name)
@@ -45,26 +53,25 @@ def doctor_command(
     verbose: bool = typer.Option(False, "--verbose", help="Reserved for future verbose output."),
 ) -> None:
     try:
+        _register_builtin_checks()
         runner = DoctorRunner(hydra_version=_resolve_hydra_version())
-        selected_checks = DoctorRunner.filter_checks(
+        runner.checks = DoctorRunner.filter_checks(
             runner.checks,
             only=_parse_csv_values(only),
             exclude=_parse_csv_values(exclude),
         )
 
         if list_checks:
-            for check in selected_checks:
+            for check in runner.checks:
                 typer.echo(f"{check.id}\t{check.category}\t{check.title}")
             raise typer.Exit(code=0)
 
-        report = DoctorRunner(hydra_version=_resolve_hydra_version(), checks=selected_checks).run(
-            context={"verbose": verbose, "deterministic": deterministic}
-        )
+        report = runner.run(context={"verbose": verbose, "deterministic": deterministic})
 
         render_report_human(report)
 
         if json_output:
-            typer.echo(json.dumps(report_to_dict(report), indent=2, ensure_ascii=False))
+            typer.echo(report_to_json(report))
 
         if not no_write:
             output_dir = export if export is not None else Path(".hydra/reports")
@@ -31,14 +31,14 @@ class CheckResult:
         if self.duration_ms < 0:
             raise ValueError("duration_ms must be >= 0")
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, copy: bool = False) -> dict[str, Any]:
         return {
             "id": self.id,
             "title": self.title,
             "category": self.category,
             "status": self.status.value,
             "message": self.message,
-            "details": dict(self.details),
+            "details": dict(self.details) if copy else self.details,
             "remediation": list(self.remediation) if self.remediation is not None else None,
             "severity": self.severity,
             "duration_ms": self.duration_ms,
@@ -82,12 +82,12 @@ class Report:
         if self.total_duration_ms < 0:
             raise ValueError("total_duration_ms must be >= 0")
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, copy: bool = False) -> dict[str, Any]:
         return {
             "schema_version": self.schema_version,
             "environment": self.environment.to_dict(),
-            "checks": [check.to_dict() for check in self.checks],
-            "summary": dict(self.summary),
+            "checks": [check.to_dict(copy=copy) for check in self.checks],
+            "summary": dict(self.summary) if copy else self.summary,
             "overall_status": self.overall_status,
             "total_duration_ms": self.total_duration_ms,
         }
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime, timezone
 from time import perf_counter
 from typing import Any, Iterable
 
-from continuum.doctor.checks.base import BaseCheck, list_checks
+from continuum.doctor.checks.base import BaseCheck, list_check_instances, run_teardown
 from continuum.doctor.models import CheckResult, EnvironmentInfo, Report, Status
 from continuum.doctor.utils.platform import (
     get_hostname,
@@ -31,10 +32,11 @@ class DoctorRunner:
     def _resolve_checks(
         checks: Iterable[BaseCheck | type[BaseCheck]] | None,
     ) -> list[BaseCheck]:
-        source = checks if checks is not None else list_checks()
-        resolved: list[BaseCheck] = []
+        if checks is None:
+            return list_check_instances()
 
-        for item in source:
+        resolved: list[BaseCheck] = []
+        for item in checks:
             if isinstance(item, type):
                 resolved.append(item())
             else:
@@ -60,9 +62,9 @@ class DoctorRunner:
             filtered.append(check)
         return filtered
 
-    def build_environment(self) -> EnvironmentInfo:
+    def build_environment(self, deterministic: bool = False) -> EnvironmentInfo:
         return EnvironmentInfo(
-            timestamp_utc=datetime.now(timezone.utc).isoformat(),
+            timestamp_utc="1970-01-01T00:00:00Z" if deterministic else datetime.now(timezone.utc).isoformat(),
             os=get_os_string(),
             python_version=get_python_version_string(),
             python_executable=get_python_executable(),
@@ -76,18 +78,7 @@ class DoctorRunner:
         runtime_context: dict[str, Any] = dict(context or {})
         deterministic = bool(runtime_context.get("deterministic", False))
 
-        environment = self.build_environment()
-        if deterministic:
-            environment = EnvironmentInfo(
-                timestamp_utc="1970-01-01T00:00:00Z",
-                os=environment.os,
-                python_version=environment.python_version,
-                python_executable=environment.python_executable,
-                is_container=environment.is_container,
-                is_wsl=environment.is_wsl,
-                hydra_version=environment.hydra_version,
-                hostname=environment.hostname,
-            )
+        environment = self.build_environment(deterministic)
 
         runtime_context.setdefault("environment", environment.to_dict())
         runtime_context.setdefault("os", environment.os)
@@ -107,6 +98,7 @@ class DoctorRunner:
         facts.setdefault("is_wsl", environment.is_wsl)
 
         results: list[CheckResult] = []
+        summary = {status.value: 0 for status in Status}
 
         for check in self.checks:
             try:
@@ -122,6 +114,7 @@ class DoctorRunner:
                     )
                     results.append(skip_result)
                     runtime_context["results"][skip_result.id] = skip_result
+                    summary[skip_result.status.value] += 1
                     continue
 
                 started = perf_counter() if not deterministic else 0.0
@@ -131,20 +124,11 @@ class DoctorRunner:
                 # Preserve reported duration when provided, else use measured runtime.
                 duration_ms = 0.0 if deterministic else (result.duration_ms if result.duration_ms > 0 else elapsed_ms)
                 if duration_ms != result.duration_ms:
-                    result = CheckResult(
-                        id=result.id,
-                        title=result.title,
-                        category=result.category,
-                        status=result.status,
-                        message=result.message,
-                        details=result.details,
-                        remediation=result.remediation,
-                        severity=result.severity,
-                        duration_ms=duration_ms,
-                    )
+                    result = replace(result, duration_ms=duration_ms)
 
                 results.append(result)
                 runtime_context["results"][result.id] = result
+                summary[result.status.value] += 1
             except Exception as exc:  # noqa: BLE001
                 error_result = CheckResult(
                     id=getattr(check, "id", check.__class__.__name__),
@@ -162,8 +146,11 @@ class DoctorRunner:
                 )
                 results.append(error_result)
                 runtime_context["results"][error_result.id] = error_result
+                summary[error_result.status.value] += 1
+
+        # Release shared handles (e.g. the NVML session) opened by the checks.
+        run_teardown(runtime_context)
 
-        summary = self._compute_summary(results)
         overall_status = self._compute_overall_status(summary)
         total_duration_ms = 0.0 if deterministic else sum(result.duration_ms for result in results)
 
@@ -176,13 +163,6 @@ class DoctorRunner:
             total_duration_ms=total_duration_ms,
         )
 
-    @staticmethod
-    def _compute_summary(results: list[CheckResult]) -> dict[str, int]:
-        counts = {status.value: 0 for status in Status}
-        for result in results:
-            counts[result.status.value] += 1
-        return counts
-
     @staticmethod
     def _compute_overall_status(summary: dict[str, int]) -> str:
         if summary.get(Status.FAIL.value, 0) > 0:
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any
+
+from continuum.doctor.checks.base import register_teardown
+
+_PYNVML_IMPORT_ERROR: str | None = None
+_SESSION_KEY = "_nvml_session"
+
+
+@dataclass(frozen=True, slots=True)
+class NvmlSession:
+    pynvml: ModuleType | None
+    import_error: str | None = None
+    init_error: str | None = None
+
+
+def load_pynvml() -> ModuleType | None:
+    """Return the pynvml module, remembering a failed import for the rest of the process."""
+    global _PYNVML_IMPORT_ERROR
+    module = sys.modules.get("pynvml")
+    if module is not None:
+        return module
+    if _PYNVML_IMPORT_ERROR is not None:
+        return None
+    try:
+        import pynvml  # type: ignore[import-not-found]
+    except Exception as exc:  # noqa: BLE001
+        _PYNVML_IMPORT_ERROR = f"{type(exc).__name__}: {exc}"
+        return None
+    return pynvml
+
+
+def nvml_session(context: dict[str, Any]) -> NvmlSession:
+    """Initialise NVML at most once per doctor run and share it between checks."""
+    facts = context.get("facts")
+    if not isinstance(facts, dict):
+        facts = {}
+        context["facts"] = facts
+
+    session = facts.get(_SESSION_KEY)
+    if isinstance(session, NvmlSession):
+        return session
+
+    pynvml = load_pynvml()
+    if pynvml is None:
+        session = NvmlSession(None, import_error=_PYNVML_IMPORT_ERROR or "pynvml is unavailable")
+    else:
+        try:
+            pynvml.nvmlInit()
+        except Exception as exc:  # noqa: BLE001
+            session = NvmlSession(None, init_error=f"{type(exc).__name__}: {exc}")
+        else:
+            session = NvmlSession(pynvml)
+            register_teardown(context, pynvml.nvmlShutdown)
+
+    facts[_SESSION_KEY] = session
+    return session
+
+
+__all__ = [
+    "NvmlSession",
+    "load_pynvml",
+    "nvml_session",
+]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import subprocess
+from typing import Any, Sequence
+
+_CACHE_KEY = "_subprocess_cache"
+
+
+def run_cached(context: dict[str, Any], argv: Sequence[str], timeout: float = 15) -> subprocess.CompletedProcess[str]:
+    """Run ``argv`` once per doctor run; later calls with the same argv reuse the result."""
+    facts = context.get("facts")
+    if not isinstance(facts, dict):
+        facts = {}
+        context["facts"] = facts
+
+    cache = facts.get(_CACHE_KEY)
+    if not isinstance(cache, dict):
+        cache = {}
+        facts[_CACHE_KEY] = cache
+
+    key = tuple(argv)
+    completed = cache.get(key)
+    if completed is None:
+        try:
+            # Capture bytes and decode once as UTF-8 rather than going through the
+            # locale-dependent text wrapper; tool output here is ASCII in practice.
+            raw = subprocess.run(
+                list(argv),
+                capture_output=True,
+                timeout=timeout,
+                check=False,
+            )
+        except (OSError, subprocess.SubprocessError) as exc:
+            # Remember launch failures and timeouts too, so a hung binary costs
+            # one timeout per run rather than one per check.
+            cache[key] = exc
+            raise
+        completed = subprocess.CompletedProcess(
+            raw.args,
+            raw.returncode,
+            stdout=_decode(raw.stdout),
+            stderr=_decode(raw.stderr),
+        )
+        cache[key] = completed
+    if isinstance(completed, BaseException):
+        raise completed
+    return completed
+
+
+def _decode(value: bytes | str | None) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return value
+
+
+__all__ = ["run_cached"]
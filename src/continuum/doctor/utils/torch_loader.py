@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import sys
+from types import ModuleType
+
+_TORCH_IMPORT_ERROR: Exception | None = None
+
+
+def load_torch() -> ModuleType:
+    """Return torch, re-raising a remembered import failure instead of retrying it.
+
+    Several checks need torch; a broken install would otherwise pay the failing
+    import (often hundreds of ms of partial module init) once per check.
+    """
+    global _TORCH_IMPORT_ERROR
+    module = sys.modules.get("torch")
+    if module is not None:
+        return module
+    if _TORCH_IMPORT_ERROR is not None:
+        raise _TORCH_IMPORT_ERROR.with_traceback(None)
+    try:
+        import torch  # type: ignore[import-not-found]
+    except Exception as exc:  # noqa: BLE001
+        _TORCH_IMPORT_ERROR = exc
+        raise
+    return torch
+
+
+__all__ = ["load_torch"]
@@ -1,13 +1,91 @@
 from __future__ import annotations
 
-import shutil
+import errno
+import os
 import subprocess
-from pathlib import Path
 from typing import Any
 
-from continuum.launch.models import AccelerationAction, AccelerationActionResult, ExecutionContext, profile_gte
+from continuum.launch.models import (
+    DEFAULT_PROFILE,
+    PROFILE_ENV_KEY,
+    AccelerationAction,
+    AccelerationActionResult,
+    ExecutionContext,
+    profile_gte,
+    which_cached,
+)
+
+_CPUFREQ_ROOT = "/sys/devices/system/cpu/cpufreq"
+_SCALING_GOVERNOR = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor"
+_CPUPOWER_COMMAND = ("cpupower", "frequency-set", "-g", "performance")
+
+
+def _read_sysfs_value(path: str) -> str | None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        data = os.read(fd, 64)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+    value = data.strip().decode("ascii", "ignore")
+    return value or None
+
+
+def _policy_governor_paths() -> list[str]:
+    try:
+        with os.scandir(_CPUFREQ_ROOT) as entries:
+            return sorted(
+                f"{entry.path}/scaling_governor" for entry in entries if entry.name.startswith("policy")
+            )
+    except OSError:
+        return []
+
+
+def _write_sysfs_value(path: str, value: bytes) -> None:
+    fd = os.open(path, os.O_WRONLY)
+    try:
+        os.write(fd, value)
+    finally:
+        os.close(fd)
+
+
+def _write_all_governors(value: str) -> tuple[int, list[str], bool]:
+    """Write ``value`` to every policy governor; returns (written, errors, denied)."""
+    payload = value.encode("ascii")
+    written = 0
+    errors: list[str] = []
+    denied = False
+    for path in _policy_governor_paths():
+        try:
+            _write_sysfs_value(path, payload)
+        except OSError as exc:
+            denied = denied or exc.errno in (errno.EACCES, errno.EPERM)
+            errors.append(f"{path}: {exc.strerror or exc}")
+        else:
+            written += 1
+    return written, errors, denied
+
+
+def _sysfs_write_command() -> str:
+    return f"echo performance > {_CPUFREQ_ROOT}/policy*/scaling_governor"
 
-_SCALING_GOVERNOR = Path("/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor")
+
+def read_cpu_governors() -> dict[str, str]:
+    """Read scaling governors once per cpufreq policy instead of once per logical CPU."""
+    governors: dict[str, str] = {}
+    for path in _policy_governor_paths():
+        value = _read_sysfs_value(path)
+        if value is not None:
+            governors[path.rsplit("/", 2)[-2]] = value
+    if not governors:
+        value = _read_sysfs_value(_SCALING_GOVERNOR)
+        if value is not None:
+            governors["cpu0"] = value
+    return governors
 
 
 class CpuGovernorAction(AccelerationAction):
@@ -19,26 +97,23 @@ class CpuGovernorAction(AccelerationAction):
     requires_root = True
     platforms = ["linux"]
     profile_min = "minimal"
+    parallel_safe = True
 
     def _read_governor(self) -> str | None:
-        if not _SCALING_GOVERNOR.exists():
-            return None
-        try:
-            return _SCALING_GOVERNOR.read_text(encoding="utf-8", errors="ignore").strip()
-        except OSError:
+        distinct = sorted(set(read_cpu_governors().values()))
+        if not distinct:
             return None
+        return ",".join(distinct)
 
     def check(self, ctx: ExecutionContext) -> tuple[bool, dict[str, Any], list[str]]:
         if not self.is_platform_supported(ctx):
             return False, {"reason": "Unsupported OS"}, ["Linux only action"]
 
-        cpupower_path = shutil.which("cpupower")
+        cpupower_path = which_cached("cpupower")
         current_governor = self._read_governor()
-        supported = cpupower_path is not None and current_governor is not None
+        supported = current_governor is not None
 
         notes: list[str] = []
-        if cpupower_path is None:
-            notes.append("cpupower not found")
         if current_governor is None:
             notes.append("scaling governor path missing")
 
@@ -53,8 +128,10 @@ class CpuGovernorAction(AccelerationAction):
             return False, [], before, notes
 
         current = before.get("current_governor")
-        recommend = profile_gte(ctx.env.get("ACCELERATE_PROFILE", "balanced"), "balanced") and current != "performance"
-        commands = ["cpupower frequency-set -g performance"]
+        recommend = profile_gte(ctx.env.get(PROFILE_ENV_KEY, DEFAULT_PROFILE), DEFAULT_PROFILE) and current != "performance"
+        commands = [_sysfs_write_command()]
+        if before.get("cpupower_path") is not None:
+            notes.append(f"Falls back to `{' '.join(_CPUPOWER_COMMAND)}` if sysfs writes are refused")
 
         if not recommend:
             notes.append("No change needed for current profile/governor")
@@ -74,7 +151,7 @@ class CpuGovernorAction(AccelerationAction):
                 risk=self.risk,
                 before=before,
                 after=before,
-                commands=[],
+                commands=(),
                 errors=[],
             )
 
@@ -89,11 +166,30 @@ class CpuGovernorAction(AccelerationAction):
                 risk=self.risk,
                 before=before,
                 after=before,
-                commands=["cpupower frequency-set -g performance"],
+                commands=(_sysfs_write_command(),),
                 errors=[],
             )
 
-        command = ["cpupower", "frequency-set", "-g", "performance"]
+        written, write_errors, denied = _write_all_governors("performance")
+        fall_back = before.get("cpupower_path") is not None and (denied or written == 0)
+        if not fall_back:
+            applied = written > 0 and not write_errors
+            return AccelerationActionResult(
+                action_id=self.id,
+                title=self.title,
+                supported=True,
+                applied=applied,
+                skipped_reason=None if applied else "Could not write scaling governors",
+                requires_root=self.requires_root,
+                risk=self.risk,
+                before=before,
+                after={"current_governor": self._read_governor(), "policies_written": written},
+                commands=(_sysfs_write_command(),),
+                errors=write_errors or ([] if applied else ["No cpufreq policies found"]),
+            )
+
+        # Direct writes were refused or found no policies; let cpupower try.
+        command = list(_CPUPOWER_COMMAND)
         try:
             completed = subprocess.run(command, capture_output=True, text=True, timeout=15, check=False)
         except Exception as exc:  # noqa: BLE001
@@ -107,7 +203,7 @@ class CpuGovernorAction(AccelerationAction):
                 risk=self.risk,
                 before=before,
                 after=before,
-                commands=[" ".join(command)],
+                commands=(" ".join(command),),
                 errors=[f"{type(exc).__name__}: {exc}"],
             )
 
@@ -128,7 +224,7 @@ class CpuGovernorAction(AccelerationAction):
             risk=self.risk,
             before=before,
             after=after,
-            commands=[" ".join(command)],
+            commands=(" ".join(command),),
             errors=[] if completed.returncode == 0 else [completed.stderr.strip() or "Unknown cpupower error"],
             returncodes={"cpupower": completed.returncode},
             stdout_tail=[line for line in completed.stdout.strip().splitlines()[-5:] if line],
@@ -136,4 +232,4 @@ class CpuGovernorAction(AccelerationAction):
         )
 
 
-__all__ = ["CpuGovernorAction"]
+__all__ = ["CpuGovernorAction", "read_cpu_governors"]
@@ -1,12 +1,30 @@
 from __future__ import annotations
 
-import re
+import csv
 import subprocess
 from typing import Any
 
-from continuum.launch.models import AccelerationAction, AccelerationActionResult, ExecutionContext, profile_gte
+from continuum.launch.models import (
+    DEFAULT_PROFILE,
+    PROFILE_ENV_KEY,
+    AccelerationAction,
+    AccelerationActionResult,
+    ExecutionContext,
+    profile_gte,
+)
 
-_PERSISTENCE_PATTERN = re.compile(r"Persistence Mode\s*:\s*(Enabled|Disabled)", re.IGNORECASE)
+_QUERY_FIELDS = ("persistence_mode", "power.limit", "clocks.max.sm")
+
+
+def _parse_query_rows(text: str) -> list[dict[str, str]]:
+    rows: list[dict[str, str]] = []
+    for row in csv.reader(text.splitlines(), skipinitialspace=True):
+        if len(row) != len(_QUERY_FIELDS):
+            continue
+        values = [value.strip() for value in row]
+        values[0] = values[0].lower()
+        rows.append(dict(zip(_QUERY_FIELDS, values)))
+    return rows
 
 
 class NvidiaPersistenceAction(AccelerationAction):
@@ -18,11 +36,79 @@ class NvidiaPersistenceAction(AccelerationAction):
     requires_root = True
     platforms = ["linux"]
     profile_min = "minimal"
+    parallel_safe = True
+
+    def _read_persistence_nvml(self) -> tuple[bool, dict[str, Any], list[str]] | None:
+        try:
+            import pynvml  # type: ignore[import-not-found]
+
+            pynvml.nvmlInit()
+        except Exception:  # noqa: BLE001
+            return None
+
+        try:
+            count = int(pynvml.nvmlDeviceGetCount())
+            modes = [
+                int(pynvml.nvmlDeviceGetPersistenceMode(pynvml.nvmlDeviceGetHandleByIndex(idx))) == 1
+                for idx in range(count)
+            ]
+        except Exception:  # noqa: BLE001
+            return None
+        finally:
+            try:
+                pynvml.nvmlShutdown()
+            except Exception:  # noqa: BLE001
+                pass
+
+        if not modes:
+            return None
+        return True, {
+            "persistence_mode": "enabled" if all(modes) else "disabled",
+            "device_count": count,
+            "source": "nvml",
+        }, []
+
+    def _enable_persistence_nvml(self) -> list[str] | None:
+        try:
+            import pynvml  # type: ignore[import-not-found]
+
+            pynvml.nvmlInit()
+        except Exception:  # noqa: BLE001
+            return None
+
+        errors: list[str] = []
+        try:
+            count = int(pynvml.nvmlDeviceGetCount())
+            if count == 0:
+                # With no GPUs, let nvidia-smi run and report the failure.
+                return None
+            enabled = getattr(pynvml, "NVML_FEATURE_ENABLED", 1)
+            for idx in range(count):
+                try:
+                    pynvml.nvmlDeviceSetPersistenceMode(pynvml.nvmlDeviceGetHandleByIndex(idx), enabled)
+                except Exception as exc:  # noqa: BLE001
+                    errors.append(f"GPU {idx}: {type(exc).__name__}: {exc}")
+        except Exception:  # noqa: BLE001
+            return None
+        finally:
+            try:
+                pynvml.nvmlShutdown()
+            except Exception:  # noqa: BLE001
+                pass
+        return errors
 
     def _read_persistence(self) -> tuple[bool, dict[str, Any], list[str]]:
+        via_nvml = self._read_persistence_nvml()
+        if via_nvml is not None:
+            return via_nvml
+
         try:
             completed = subprocess.run(
-                ["nvidia-smi", "-q", "-d", "PERFORMANCE"],
+                [
+                    "nvidia-smi",
+                    f"--query-gpu={','.join(_QUERY_FIELDS)}",
+                    "--format=csv,noheader,nounits",
+                ],
                 capture_output=True,
                 text=True,
                 timeout=15,
@@ -36,14 +122,17 @@ class NvidiaPersistenceAction(AccelerationAction):
                 "stdout": completed.stdout.strip(),
                 "stderr": completed.stderr.strip(),
                 "returncode": completed.returncode,
-            }, ["nvidia-smi -q returned non-zero exit code"]
+            }, ["nvidia-smi --query-gpu returned non-zero exit code"]
 
-        text = completed.stdout
-        match = _PERSISTENCE_PATTERN.search(text)
-        state = None if match is None else match.group(1).lower()
+        gpus = _parse_query_rows(completed.stdout)
+        modes = {gpu["persistence_mode"] for gpu in gpus}
+        state: str | None = None
+        if modes and modes <= {"enabled", "disabled"}:
+            state = "disabled" if "disabled" in modes else "enabled"
         return True, {
             "persistence_mode": state,
-            "raw_excerpt": text[:600],
+            "gpus": gpus[:8],
+            "raw_excerpt": completed.stdout[:600],
         }, [] if state is not None else ["Could not parse persistence mode"]
 
     def check(self, ctx: ExecutionContext) -> tuple[bool, dict[str, Any], list[str]]:
@@ -61,7 +150,7 @@ class NvidiaPersistenceAction(AccelerationAction):
             return False, [], before, notes
 
         state = before.get("persistence_mode")
-        recommend = profile_gte(ctx.env.get("ACCELERATE_PROFILE", "balanced"), "balanced") and state != "enabled"
+        recommend = profile_gte(ctx.env.get(PROFILE_ENV_KEY, DEFAULT_PROFILE), DEFAULT_PROFILE) and state != "enabled"
         commands = ["nvidia-smi -pm 1"]
 
         if not recommend:
@@ -82,7 +171,7 @@ class NvidiaPersistenceAction(AccelerationAction):
                 risk=self.risk,
                 before=before,
                 after=before,
-                commands=[],
+                commands=(),
                 errors=[],
             )
 
@@ -97,10 +186,31 @@ class NvidiaPersistenceAction(AccelerationAction):
                 risk=self.risk,
                 before=before,
                 after=before,
-                commands=["nvidia-smi -pm 1"],
+                commands=("nvidia-smi -pm 1",),
                 errors=[],
             )
 
+        nvml_errors = self._enable_persistence_nvml()
+        if nvml_errors is not None:
+            recheck_supported, after_state, recheck_notes = self._read_persistence()
+            return AccelerationActionResult(
+                action_id=self.id,
+                title=self.title,
+                supported=True,
+                applied=not nvml_errors,
+                skipped_reason=None if not nvml_errors else "NVML could not enable persistence mode",
+                requires_root=self.requires_root,
+                risk=self.risk,
+                before=before,
+                after={
+                    **after_state,
+                    "recheck_supported": recheck_supported,
+                    "recheck_notes": recheck_notes,
+                },
+                commands=("nvidia-smi -pm 1",),
+                errors=nvml_errors,
+            )
+
         command = ["nvidia-smi", "-pm", "1"]
         try:
             completed = subprocess.run(command, capture_output=True, text=True, timeout=15, check=False)
@@ -115,7 +225,7 @@ class NvidiaPersistenceAction(AccelerationAction):
                 risk=self.risk,
                 before=before,
                 after=before,
-                commands=[" ".join(command)],
+                commands=(" ".join(command),),
                 errors=[f"{type(exc).__name__}: {exc}"],
             )
 
@@ -139,7 +249,7 @@ class NvidiaPersistenceAction(AccelerationAction):
             risk=self.risk,
             before=before,
             after=after,
-            commands=[" ".join(command)],
+            commands=(" ".join(command),),
             errors=[] if completed.returncode == 0 else [completed.stderr.strip() or "Unknown nvidia-smi error"],
             returncodes={"nvidia-smi -pm 1": completed.returncode},
             stdout_tail=[line for line in completed.stdout.strip().splitlines()[-5:] if line],
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-import shutil
 from typing import Any
 
-from continuum.launch.models import AccelerationAction, AccelerationActionResult, ExecutionContext, profile_gte
+from continuum.launch.models import (
+    DEFAULT_PROFILE,
+    PROFILE_ENV_KEY,
+    AccelerationAction,
+    AccelerationActionResult,
+    ExecutionContext,
+    profile_gte,
+    which_cached,
+)
 
 
 class ProcessPriorityAction(AccelerationAction):
@@ -15,22 +22,23 @@ class ProcessPriorityAction(AccelerationAction):
     requires_root = False
     platforms = ["linux", "windows", "macos"]
     profile_min = "minimal"
+    parallel_safe = True
 
     def _commands(self, ctx: ExecutionContext) -> list[str]:
         commands = ["nice -n -5 <your_command>"]
-        if ctx.is_linux and shutil.which("ionice"):
+        if ctx.is_linux and which_cached("ionice"):
             commands.append("ionice -c2 -n0 <your_command>")
         return commands
 
     def check(self, ctx: ExecutionContext) -> tuple[bool, dict[str, Any], list[str]]:
         return True, {
-            "ionice_available": bool(shutil.which("ionice")) if ctx.is_linux else False,
+            "ionice_available": bool(which_cached("ionice")) if ctx.is_linux else False,
             "os_name": ctx.os_name,
         }, []
 
     def plan(self, ctx: ExecutionContext) -> tuple[bool, list[str], dict[str, Any], list[str]]:
         supported, before, notes = self.check(ctx)
-        recommend = supported and profile_gte(ctx.env.get("ACCELERATE_PROFILE", "balanced"), "balanced")
+        recommend = supported and profile_gte(ctx.env.get(PROFILE_ENV_KEY, DEFAULT_PROFILE), DEFAULT_PROFILE)
         commands = self._commands(ctx)
         if not recommend:
             notes.append("Lower profile requested; suggestions remain optional")
@@ -49,7 +57,7 @@ class ProcessPriorityAction(AccelerationAction):
             risk=self.risk,
             before=before,
             after={"suggestions": commands, "notes": notes},
-            commands=commands,
+            commands=tuple(commands),
             errors=[],
         )
 
@@ -1,41 +1,93 @@
 from __future__ import annotations
 
-import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 import typer
-try:
+
+from continuum.launch.launcher import launch_training_script
+from continuum.launch.models import HIGH_RISK, AccelerationActionResult, ExecutionContext, parse_csv_set
+from continuum.launch.plan_builder import build_context, build_plan
+from continuum.launch.plugins.loader import PluginLoadResult, build_hook_env, run_shell_hooks
+from continuum.launch.reporting import build_report, dump_json, print_json_bytes, render_summary, write_state_report
+
+if TYPE_CHECKING:
     from rich.console import Console
-    from rich.table import Table
-except Exception:  # pragma: no cover
-    class Console:  # type: ignore[no-redef]
-        def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
-            self._stderr = bool(kwargs.get("stderr", False))
 
-        def print(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
-            typer.echo(" ".join(str(arg) for arg in args), err=self._stderr)
+Profile = Literal["minimal", "balanced", "max", "expert"]
+
+_YES_NO = ("no", "yes")
+_MAX_APPLY_WORKERS = 8
 
-    class Table:  # type: ignore[no-redef]
-        def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
-            self._continuum_fallback_table = True
-            self.title = str(kwargs.get("title", "")) if kwargs.get("title") is not None else ""
-            self.rows: list[tuple[str, ...]] = []
 
-        def add_column(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
-            return None
+class _FallbackConsole:
+    def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        self._stderr = bool(kwargs.get("stderr", False))
 
-        def add_row(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
-            self.rows.append(tuple(str(arg) for arg in args))
+    def print(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        typer.echo(" ".join(str(arg) for arg in args), err=self._stderr)
 
-from continuum.launch.launcher import launch_training_script
-from continuum.launch.models import AccelerationActionResult, ExecutionContext, parse_csv_set
-from continuum.launch.plan_builder import build_plan
-from continuum.launch.plugins.loader import PluginLoadResult, run_shell_hooks
-from continuum.launch.reporting import build_report, render_summary, write_state_report
-from continuum.launch.ui.interactive import select_actions_interactively
 
-Profile = Literal["minimal", "balanced", "max", "expert"]
+class _FallbackTable:
+    def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        self._continuum_fallback_table = True
+        self.title = str(kwargs.get("title", "")) if kwargs.get("title") is not None else ""
+        self.rows: list[tuple[str, ...]] = []
+
+    def add_column(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        return None
+
+    def add_row(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        self.rows.append(tuple(str(arg) for arg in args))
+
+
+# rich is only needed for human output; import it on first use so --json and
+# --quiet runs never pay for it.
+_RICH: tuple[type, type] | None = None
+
+
+def _rich() -> tuple[type, type]:
+    global _RICH
+    if _RICH is None:
+        try:
+            from rich.console import Console as RichConsole
+            from rich.table import Table as RichTable
+
+            _RICH = (RichConsole, RichTable)
+        except Exception:  # pragma: no cover
+            _RICH = (_FallbackConsole, _FallbackTable)
+    return _RICH
+
+
+_CONSOLE: Console | None = None
+
+
+def _console() -> Console:
+    # Shared stderr console; rich resolves sys.stderr at print time so reuse is safe.
+    global _CONSOLE
+    if _CONSOLE is None:
+        _CONSOLE = _rich()[0](stderr=True)
+    return _CONSOLE
+
+
+def _stderr_is_terminal() -> bool:
+    try:
+        return sys.stderr.isatty()
+    except Exception:  # noqa: BLE001
+        return False
+
+
+def _select_console(quiet_human: bool, interactive: bool) -> Console | None:
+    if quiet_human and not interactive:
+        return None
+    # Redirected/piped stderr gets plain lines; rich is only worth loading for a terminal
+    # or for the interactive prompt, which renders a rich table itself.
+    if interactive or _stderr_is_terminal():
+        return _console()
+    return _FallbackConsole(stderr=True)  # type: ignore[return-value]
 
 
 class UsageError(Exception):
@@ -47,7 +99,8 @@ def _eprint(message: str) -> None:
 
 
 def _render_plan(plan_dict: dict, console: Console) -> None:
-    table = Table(title=f"Hydra Launch Plan ({plan_dict['profile']})")
+    table_cls = _FallbackTable if isinstance(console, _FallbackConsole) else _rich()[1]
+    table = table_cls(title=f"Hydra Launch Plan ({plan_dict['profile']})")
     table.add_column("Recommended", no_wrap=True)
     table.add_column("Supported", no_wrap=True)
     table.add_column("ID")
@@ -55,15 +108,20 @@ def _render_plan(plan_dict: dict, console: Console) -> None:
     table.add_column("Risk", no_wrap=True)
     table.add_column("Root", no_wrap=True)
 
-    for item in sorted(plan_dict.get("recommendations", []), key=lambda rec: rec.get("action_id", "")):
-        table.add_row(
-            "yes" if item.get("recommended") else "no",
-            "yes" if item.get("supported") else "no",
+    # build_plan already emits recommendations in action-id order.
+    rows = [
+        (
+            _YES_NO[bool(item.get("recommended"))],
+            _YES_NO[bool(item.get("supported"))],
             item.get("action_id", ""),
             item.get("category", ""),
             item.get("risk", ""),
-            "yes" if item.get("requires_root") else "no",
+            _YES_NO[bool(item.get("requires_root"))],
         )
+        for item in plan_dict.get("recommendations", [])
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     if getattr(table, "_continuum_fallback_table", False):
         console.print(f"Hydra Launch Plan ({plan_dict['profile']})")
@@ -75,7 +133,7 @@ def _render_plan(plan_dict: dict, console: Console) -> None:
 
 def _build_dry_run_results(plan_dict: dict) -> list[AccelerationActionResult]:
     results: list[AccelerationActionResult] = []
-    for item in sorted(plan_dict.get("recommendations", []), key=lambda rec: rec.get("action_id", "")):
+    for item in plan_dict.get("recommendations", []):
         results.append(
             AccelerationActionResult(
                 action_id=item["action_id"],
@@ -87,22 +145,113 @@ def _build_dry_run_results(plan_dict: dict) -> list[AccelerationActionResult]:
                 risk=item["risk"],
                 before={},
                 after={},
-                commands=list(item.get("commands", [])),
+                commands=tuple(item.get("commands") or ()),
                 errors=[],
             )
         )
     return results
 
 
+def _unapplied_result(
+    item: dict,
+    *,
+    supported: bool,
+    skipped_reason: str,
+    after: dict | None = None,
+    errors: list[str] | None = None,
+) -> AccelerationActionResult:
+    action = item["action"]
+    before = item.get("before", {})
+    return AccelerationActionResult(
+        action_id=action.id,
+        title=action.title,
+        supported=supported,
+        applied=False,
+        skipped_reason=skipped_reason,
+        requires_root=action.requires_root,
+        risk=action.risk,
+        before=before,
+        after=before if after is None else after,
+        commands=tuple(item.get("commands") or ()),
+        errors=errors if errors is not None else [],
+    )
+
+
+def _apply_one(item: dict, ctx: ExecutionContext) -> AccelerationActionResult:
+    try:
+        return item["action"].apply(ctx)
+    except Exception as exc:  # noqa: BLE001
+        return _unapplied_result(
+            item,
+            supported=True,
+            skipped_reason="Action apply raised an exception",
+            errors=[f"{type(exc).__name__}: {exc}"],
+        )
+
+
+def _apply_actions(
+    internal_data: list[dict],
+    selected_ids: set[str],
+    ctx: ExecutionContext,
+) -> list[AccelerationActionResult]:
+    selected = frozenset(selected_ids)
+    if not selected:
+        return [
+            _unapplied_result(
+                item,
+                supported=bool(item["supported"]),
+                skipped_reason="Not selected",
+                after=item.get("after_preview", {}),
+            )
+            for item in internal_data
+        ]
+
+    results: list[AccelerationActionResult | None] = [None] * len(internal_data)
+    parallel_jobs: list[int] = []
+    serial_jobs: list[int] = []
+
+    for index, item in enumerate(internal_data):
+        action = item["action"]
+
+        if action.id not in selected:
+            results[index] = _unapplied_result(
+                item,
+                supported=bool(item["supported"]),
+                skipped_reason="Not selected",
+                after=item.get("after_preview", {}),
+            )
+        elif not item["supported"]:
+            results[index] = _unapplied_result(item, supported=False, skipped_reason="Unsupported on this environment")
+        elif getattr(action, "parallel_safe", False):
+            parallel_jobs.append(index)
+        else:
+            serial_jobs.append(index)
+
+    # Independent actions mostly wait on subprocesses, so overlap them; the rest
+    # run one at a time after the parallel batch. Results keep plan order.
+    if len(parallel_jobs) > 1:
+        with ThreadPoolExecutor(max_workers=min(_MAX_APPLY_WORKERS, len(parallel_jobs))) as executor:
+            applied = executor.map(_apply_one, [internal_data[index] for index in parallel_jobs], repeat(ctx))
+            for index, result in zip(parallel_jobs, applied):
+                results[index] = result
+    else:
+        serial_jobs = parallel_jobs + serial_jobs
+
+    for index in serial_jobs:
+        results[index] = _apply_one(internal_data[index], ctx)
+
+    return [result for result in results if result is not None]
+
+
 def _auto_selection(plan_dict: dict, expert_mode: bool) -> set[str]:
-    selected: set[str] = set()
-    for item in plan_dict.get("recommendations", []):
-        if not item.get("recommended") or not item.get("supported"):
-            continue
-        if item.get("risk", "").lower() == "high" and not expert_mode:
-            continue
-        selected.add(item["action_id"])
-    return selected
+    recommendations = plan_dict.get("recommendations", ())
+    if expert_mode:
+        return {item["action_id"] for item in recommendations if item.get("recommended") and item.get("supported")}
+    return {
+        item["action_id"]
+        for item in recommendations
+        if item.get("recommended") and item.get("supported") and item.get("risk", "").lower() != HIGH_RISK
+    }
 
 
 def _is_supported_os(ctx: ExecutionContext) -> bool:
@@ -130,16 +279,17 @@ def _validate_filter_option(name: str, value: str | None, known_categories: set[
     return parsed
 
 
-def _write_report_if_enabled(report: dict, out: Path | None, no_state_write: bool) -> None:
-    if no_state_write:
-        if out is not None:
-            write_state_report(report, out=out, cwd=Path.cwd())
-        return
-    write_state_report(report, out=out, cwd=Path.cwd())
+def _write_report_if_enabled(report: dict, out: Path | None, no_state_write: bool, cwd: Path) -> bytes | None:
+    if no_state_write and out is None:
+        return None
+    payload = dump_json(report, sort_keys=True, append_newline=True)
+    write_state_report(report, out=out, cwd=cwd, payload=payload)
+    return payload
 
 
-def _print_json_stdout(report: dict) -> None:
-    print(json.dumps(report, indent=2, sort_keys=True, ensure_ascii=False))
+def _print_json_stdout(report: dict, payload: bytes | None = None) -> None:
+    # Reuse the bytes already written to the state file when available.
+    print_json_bytes(payload if payload is not None else dump_json(report, sort_keys=True, append_newline=True))
 
 
 def _run_plan_mode(
@@ -156,18 +306,24 @@ def _run_plan_mode(
     quiet_human: bool,
     no_state_write: bool,
     no_timestamp: bool,
-    console: Console,
+    console: Console | None,
 ) -> int:
     effective_dry_run = _parse_mode_flags(dry_run=dry_run, apply=apply)
     expert_mode = profile == "expert"
 
+    # Resolve cwd and the execution context once; both plan builds share them.
+    cwd = Path.cwd()
+    base_ctx = build_context(cwd)
+
     probe_plan, _, _, _ = build_plan(
         profile=profile,
         only=None,
         exclude=None,
         expert_mode=expert_mode,
         include_timestamp=not no_timestamp,
-        cwd=Path.cwd(),
+        cwd=cwd,
+        ctx=base_ctx,
+        run_probes=False,
     )
     known_categories = {rec.category.lower() for rec in probe_plan.recommendations}
 
@@ -180,7 +336,8 @@ def _run_plan_mode(
         exclude=exclude_set,
         expert_mode=expert_mode,
         include_timestamp=not no_timestamp,
-        cwd=Path.cwd(),
+        cwd=cwd,
+        ctx=base_ctx,
     )
 
     if verbose:
@@ -199,9 +356,9 @@ def _run_plan_mode(
             plugin_result=plugin_result,
             hook_warnings=["Skipped: not supported on this OS."],
         )
-        _write_report_if_enabled(report, out, no_state_write)
+        payload = _write_report_if_enabled(report, out, no_state_write, cwd)
         if json_output:
-            _print_json_stdout(report)
+            _print_json_stdout(report, payload)
         elif not quiet_human:
             _eprint("Skipped: not supported on this OS.")
         return 0
@@ -225,17 +382,19 @@ def _run_plan_mode(
             plugin_result=plugin_result,
             hook_warnings=[],
         )
-        _write_report_if_enabled(report, out, no_state_write)
+        payload = _write_report_if_enabled(report, out, no_state_write, cwd)
         if not quiet_human:
             render_summary(report, console)
         if json_output:
-            _print_json_stdout(report)
+            _print_json_stdout(report, payload)
         return 0
 
     if json_output and interactive:
         raise UsageError("--interactive cannot be used with --json")
 
     if interactive:
+        from continuum.launch.ui.interactive import select_actions_interactively
+
         selected_ids = select_actions_interactively(plan.recommendations, console=console)
         if not typer.confirm("Apply selected actions?", default=False):
             if not quiet_human:
@@ -244,77 +403,25 @@ def _run_plan_mode(
     else:
         selected_ids = _auto_selection(plan_dict, expert_mode)
 
-    plan_payload = plan.to_dict()
+    # plan_dict is not read again past this point, so hooks can share it.
+    plan_payload = plan_dict
     ctx_payload = ctx.to_dict()
+    hook_env = build_hook_env(ctx_payload, selected_ids)
 
-    hook_warnings.extend(run_shell_hooks(plugin_result.hooks.pre_apply_shell, ctx_payload, plan_payload, selected_ids))
+    hook_warnings.extend(
+        run_shell_hooks(plugin_result.hooks.pre_apply_shell, ctx_payload, plan_payload, selected_ids, env=hook_env)
+    )
     for callback in plugin_result.hooks.pre_apply_py:
         try:
             callback(ctx_payload, plan_payload, selected_ids)
         except Exception as exc:  # noqa: BLE001
             hook_warnings.append(f"Python pre hook failed: {type(exc).__name__}: {exc}")
 
-    results: list[AccelerationActionResult] = []
-    for item in internal_data:
-        action = item["action"]
-        supported = bool(item["supported"])
-
-        if action.id not in selected_ids:
-            results.append(
-                AccelerationActionResult(
-                    action_id=action.id,
-                    title=action.title,
-                    supported=supported,
-                    applied=False,
-                    skipped_reason="Not selected",
-                    requires_root=action.requires_root,
-                    risk=action.risk,
-                    before=item.get("before", {}),
-                    after=item.get("after_preview", {}),
-                    commands=list(item.get("commands", [])),
-                    errors=[],
-                )
-            )
-            continue
-
-        if not supported:
-            results.append(
-                AccelerationActionResult(
-                    action_id=action.id,
-                    title=action.title,
-                    supported=False,
-                    applied=False,
-                    skipped_reason="Unsupported on this environment",
-                    requires_root=action.requires_root,
-                    risk=action.risk,
-                    before=item.get("before", {}),
-                    after=item.get("before", {}),
-                    commands=list(item.get("commands", [])),
-                    errors=[],
-                )
-            )
-            continue
-
-        try:
-            results.append(action.apply(ctx))
-        except Exception as exc:  # noqa: BLE001
-            results.append(
-                AccelerationActionResult(
-                    action_id=action.id,
-                    title=action.title,
-                    supported=True,
-                    applied=False,
-                    skipped_reason="Action apply raised an exception",
-                    requires_root=action.requires_root,
-                    risk=action.risk,
-                    before=item.get("before", {}),
-                    after=item.get("before", {}),
-                    commands=list(item.get("commands", [])),
-                    errors=[f"{type(exc).__name__}: {exc}"],
-                )
-            )
+    results = _apply_actions(internal_data, selected_ids, ctx)
 
-    hook_warnings.extend(run_shell_hooks(plugin_result.hooks.post_apply_shell, ctx_payload, plan_payload, selected_ids))
+    hook_warnings.extend(
+        run_shell_hooks(plugin_result.hooks.post_apply_shell, ctx_payload, plan_payload, selected_ids, env=hook_env)
+    )
     for callback in plugin_result.hooks.post_apply_py:
         try:
             callback(ctx_payload, plan_payload, selected_ids)
@@ -330,7 +437,7 @@ def _run_plan_mode(
         plugin_result=plugin_result,
         hook_warnings=hook_warnings,
     )
-    _write_report_if_enabled(report, out, no_state_write)
+    payload = _write_report_if_enabled(report, out, no_state_write, cwd)
 
     if not quiet_human:
         render_summary(report, console)
@@ -339,7 +446,7 @@ def _run_plan_mode(
         _eprint("Warning: --apply completed but no actions were applied.")
 
     if json_output:
-        _print_json_stdout(report)
+        _print_json_stdout(report, payload)
 
     return 0
 
@@ -358,8 +465,8 @@ def accelerate_command(
     no_state_write: bool = typer.Option(False, "--no-state-write", help="Do not write .hydra/state/launch_latest.json."),
     no_timestamp: bool = typer.Option(False, "--no-timestamp", help="Disable timestamps for deterministic planner JSON outputs."),
 ) -> None:
-    console = Console(stderr=True)
     quiet_human = quiet or json_output
+    console = _select_console(quiet_human, interactive)
 
     try:
         exit_code = _run_plan_mode(
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import os
 import signal
 import subprocess
@@ -11,9 +10,19 @@ from pathlib import Path
 from time import monotonic
 from typing import Any
 
-from continuum.launch.reporting import write_json
+from continuum.launch.reporting import dump_json, print_json_bytes, write_json_bytes
 
 _CHECKPOINT_PATTERNS = ("*.ckpt", "*.pt", "*.pth", "*.safetensors")
+_KNOWN_RESUME_FLAGS = frozenset(
+    {
+        "--resume",
+        "--resume-from",
+        "--checkpoint",
+        "--checkpoint-path",
+        "--ckpt",
+        "--ckpt_path",
+    }
+)
 
 
 def _utc_now() -> str:
@@ -46,15 +55,7 @@ def _infer_resume_args(script_args: list[str], checkpoint: Path | None) -> tuple
     if checkpoint is None:
         return list(script_args), "no checkpoint discovered"
 
-    known_resume_flags = {
-        "--resume",
-        "--resume-from",
-        "--checkpoint",
-        "--checkpoint-path",
-        "--ckpt",
-        "--ckpt_path",
-    }
-    if any(arg in known_resume_flags for arg in script_args):
+    if not _KNOWN_RESUME_FLAGS.isdisjoint(script_args):
         return list(script_args), "resume flag already supplied"
 
     return [*script_args, "--resume", str(checkpoint)], "appended --resume <checkpoint>"
@@ -167,6 +168,40 @@ def _run_once(
     return return_code, attempt_report, checkpoint_seen
 
 
+def _build_runtime_report(
+    *,
+    run_id: str,
+    mode: str,
+    script: Path,
+    script_args: list[str],
+    command_argv: list[str],
+    status: str,
+    attempts: list[dict[str, Any]],
+    restarts_used: int,
+    max_restarts: int,
+    latest_checkpoint: Path | None,
+    log_path: Path,
+    error: str | None,
+    exit_code: int,
+) -> dict[str, Any]:
+    return {
+        "schema_version": "launch.runtime.v1",
+        "run_id": run_id,
+        "mode": mode,
+        "script": str(script),
+        "script_args": list(script_args),
+        "command_argv": list(command_argv),
+        "status": status,
+        "attempts": attempts,
+        "restarts_used": restarts_used,
+        "max_restarts": max_restarts,
+        "latest_checkpoint": str(latest_checkpoint) if latest_checkpoint else None,
+        "log_path": str(log_path),
+        "error": error,
+        "exit_code": exit_code,
+    }
+
+
 def launch_training_script(
     script: Path,
     script_args: list[str],
@@ -192,28 +227,28 @@ def launch_training_script(
         _stderr_print(f"[launch][debug] script_args={script_args!r}", quiet=False)
 
     if dry_run:
-        report = {
-            "schema_version": "launch.runtime.v1",
-            "run_id": run_id,
-            "mode": "dry-run",
-            "script": str(script),
-            "script_args": list(script_args),
-            "command_argv": list(base_command_argv),
-            "status": "dry-run",
-            "attempts": [],
-            "restarts_used": 0,
-            "max_restarts": max_restarts,
-            "latest_checkpoint": str(_scan_checkpoints(cwd)) if _scan_checkpoints(cwd) else None,
-            "log_path": str(log_path),
-            "error": None,
-            "exit_code": 0,
-        }
+        report = _build_runtime_report(
+            run_id=run_id,
+            mode="dry-run",
+            script=script,
+            script_args=script_args,
+            command_argv=base_command_argv,
+            status="dry-run",
+            attempts=[],
+            restarts_used=0,
+            max_restarts=max_restarts,
+            latest_checkpoint=_scan_checkpoints(cwd),
+            log_path=log_path,
+            error=None,
+            exit_code=0,
+        )
+        payload = dump_json(report, sort_keys=True, append_newline=True)
         if not no_state_write:
-            write_json(cwd / ".hydra" / "state" / "launch_latest.json", report)
+            write_json_bytes(cwd / ".hydra" / "state" / "launch_latest.json", payload)
         if out is not None:
-            write_json(out, report)
+            write_json_bytes(out, payload)
         if json_output:
-            print(json.dumps(report, indent=2, sort_keys=True, ensure_ascii=False))
+            print_json_bytes(payload)
         return 0, report
 
     attempts: list[dict[str, Any]] = []
@@ -266,31 +301,32 @@ def launch_training_script(
         error = "Interrupted by user"
 
     exit_code = 130 if interrupted else (0 if status == "completed" else 1)
-    report = {
-        "schema_version": "launch.runtime.v1",
-        "run_id": run_id,
-        "mode": "apply",
-        "script": str(script),
-        "script_args": list(script_args),
-        "command_argv": list(base_command_argv),
-        "status": status,
-        "attempts": attempts,
-        "restarts_used": restarts_used,
-        "max_restarts": max_restarts,
-        "latest_checkpoint": str(latest_checkpoint) if latest_checkpoint else None,
-        "log_path": str(log_path),
-        "error": error,
-        "exit_code": exit_code,
-    }
+    report = _build_runtime_report(
+        run_id=run_id,
+        mode="apply",
+        script=script,
+        script_args=script_args,
+        command_argv=base_command_argv,
+        status=status,
+        attempts=attempts,
+        restarts_used=restarts_used,
+        max_restarts=max_restarts,
+        latest_checkpoint=latest_checkpoint,
+        log_path=log_path,
+        error=error,
+        exit_code=exit_code,
+    )
 
-    write_json(run_dir / "report.json", report)
+    # One serialization shared by the run report, state file, --out and stdout.
+    payload = dump_json(report, sort_keys=True, append_newline=True)
+    write_json_bytes(run_dir / "report.json", payload)
     if not no_state_write:
-        write_json(cwd / ".hydra" / "state" / "launch_latest.json", report)
+        write_json_bytes(cwd / ".hydra" / "state" / "launch_latest.json", payload)
     if out is not None:
-        write_json(out, report)
+        write_json_bytes(out, payload)
 
     if json_output:
-        print(json.dumps(report, indent=2, sort_keys=True, ensure_ascii=False))
+        print_json_bytes(payload)
     elif error is not None:
         _stderr_print(f"[launch] error: {error}", quiet)
 
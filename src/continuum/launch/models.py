@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import platform
+import shutil
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from hashlib import sha1
 from pathlib import Path
 from typing import Any
 
 
 ACCELERATE_SCHEMA_VERSION = "launch.v1"
+DEFAULT_PROFILE = "balanced"
+HIGH_RISK = "high"
+PROFILE_ENV_KEY = "ACCELERATE_PROFILE"
 PROFILE_ORDER = {
     "minimal": 0,
     "balanced": 1,
@@ -127,7 +133,7 @@ class AccelerationActionResult:
     risk: str
     before: dict[str, Any] = field(default_factory=dict)
     after: dict[str, Any] = field(default_factory=dict)
-    commands: list[str] = field(default_factory=list)
+    commands: tuple[str, ...] = ()
     errors: list[str] = field(default_factory=list)
     returncodes: dict[str, int] = field(default_factory=dict)
     stdout_tail: list[str] = field(default_factory=list)
@@ -165,14 +171,17 @@ class AccelerationAction(ABC):
     requires_root: bool = False
     platforms: list[str] = ["linux", "windows", "macos"]
     profile_min: str = "minimal"
+    # Opt-in: actions that touch no shared state may be applied concurrently.
+    parallel_safe: bool = False
 
     def is_platform_supported(self, ctx: ExecutionContext) -> bool:
-        if ctx.is_linux and "linux" in self.platforms:
-            return True
-        if ctx.is_windows and "windows" in self.platforms:
-            return True
-        if ctx.is_macos and "macos" in self.platforms:
-            return True
+        platforms = self.platforms
+        if ctx.is_linux:
+            return "linux" in platforms
+        if ctx.is_windows:
+            return "windows" in platforms
+        if ctx.is_macos:
+            return "macos" in platforms
         return False
 
     @abstractmethod
@@ -195,10 +204,20 @@ def profile_gte(profile: str, minimum: str) -> bool:
     return PROFILE_ORDER.get(profile, -1) >= PROFILE_ORDER.get(minimum, -1)
 
 
+@lru_cache(maxsize=None)
+def which_cached(name: str) -> str | None:
+    return shutil.which(name)
+
+
+@lru_cache(maxsize=1)
+def system_name() -> str:
+    return platform.system().lower()
+
+
 def normalize_profile(profile: str) -> str:
     candidate = profile.strip().lower()
     if candidate not in PROFILE_ORDER:
-        return "balanced"
+        return DEFAULT_PROFILE
     return candidate
 
 
@@ -216,6 +235,9 @@ def state_root(cwd: Path | None = None) -> Path:
 
 __all__ = [
     "ACCELERATE_SCHEMA_VERSION",
+    "DEFAULT_PROFILE",
+    "HIGH_RISK",
+    "PROFILE_ENV_KEY",
     "PROFILE_ORDER",
     "ExecutionContext",
     "ActionDescriptor",
@@ -223,6 +245,8 @@ __all__ = [
     "AccelerationActionResult",
     "AccelerationAction",
     "profile_gte",
+    "which_cached",
+    "system_name",
     "normalize_profile",
     "parse_csv_set",
     "state_root",
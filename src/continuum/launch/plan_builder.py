@@ -1,23 +1,35 @@
 from __future__ import annotations
 
-import json
 import os
-import platform
-import shutil
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
 from continuum.launch.actions import register_builtin_actions
-from continuum.launch.models import ActionDescriptor, AccelerationAction, AccelerationPlan, ExecutionContext, normalize_profile
+from continuum.launch.models import (
+    HIGH_RISK,
+    PROFILE_ENV_KEY,
+    ActionDescriptor,
+    AccelerationAction,
+    AccelerationPlan,
+    ExecutionContext,
+    normalize_profile,
+    system_name,
+    which_cached,
+)
 from continuum.launch.plugins.loader import PluginLoadResult, load_plugins
 from continuum.launch.registry import clear_registry, filter_actions, get_actions, register_action
+from continuum.launch.reporting import load_json
+
+_MAX_PROBE_WORKERS = 8
 
 
 def _load_doctor_facts(cwd: Path) -> dict[str, Any] | None:
     state_candidate = cwd / ".hydra" / "state" / "doctor_latest.json"
     if state_candidate.exists():
         try:
-            return json.loads(state_candidate.read_text(encoding="utf-8"))
+            return load_json(state_candidate)
         except Exception:  # noqa: BLE001
             return None
 
@@ -26,7 +38,7 @@ def _load_doctor_facts(cwd: Path) -> dict[str, Any] | None:
         candidates = sorted(reports_dir.glob("doctor_*.json"), reverse=True)
         if candidates:
             try:
-                return json.loads(candidates[0].read_text(encoding="utf-8"))
+                return load_json(candidates[0])
             except Exception:  # noqa: BLE001
                 return None
 
@@ -35,14 +47,14 @@ def _load_doctor_facts(cwd: Path) -> dict[str, Any] | None:
 
 def build_context(cwd: Path | None = None) -> ExecutionContext:
     base = cwd if cwd is not None else Path.cwd()
-    os_name = platform.system().lower()
+    os_name = system_name()
     return ExecutionContext(
         os_name=os_name,
         is_linux=os_name == "linux",
         is_windows=os_name == "windows",
         is_macos=os_name == "darwin",
         user_is_root=(hasattr(os, "geteuid") and os.geteuid() == 0),
-        has_nvidia_smi=shutil.which("nvidia-smi") is not None,
+        has_nvidia_smi=which_cached("nvidia-smi") is not None,
         doctor_facts=_load_doctor_facts(base),
         env=dict(os.environ),
         cwd=str(base),
@@ -50,6 +62,29 @@ def build_context(cwd: Path | None = None) -> ExecutionContext:
     )
 
 
+_Probe = tuple[bool, dict[str, Any], list[str], bool, list[str], dict[str, Any], list[str]]
+
+
+def _probe_action(action: AccelerationAction, ctx: ExecutionContext) -> _Probe:
+    supported = False
+    before: dict[str, Any] = {}
+    check_notes: list[str] = []
+    plan_notes: list[str] = []
+    commands: list[str] = []
+    after_preview: dict[str, Any] = {}
+    recommended = False
+
+    try:
+        supported, before, check_notes = action.check(ctx)
+        if supported:
+            recommended, commands, after_preview, plan_notes = action.plan(ctx)
+    except Exception as exc:  # noqa: BLE001
+        supported = False
+        check_notes = [f"{type(exc).__name__}: {exc}"]
+
+    return supported, before, check_notes, recommended, commands, after_preview, plan_notes
+
+
 def build_plan(
     profile: str,
     only: set[str] | None,
@@ -57,9 +92,12 @@ def build_plan(
     expert_mode: bool = False,
     include_timestamp: bool = True,
     cwd: Path | None = None,
+    ctx: ExecutionContext | None = None,
+    run_probes: bool = True,
 ) -> tuple[AccelerationPlan, list[dict[str, Any]], ExecutionContext, PluginLoadResult]:
     base = cwd if cwd is not None else Path.cwd()
-    ctx = build_context(base)
+    if ctx is None:
+        ctx = build_context(base)
     normalized_profile = normalize_profile(profile)
 
     clear_registry()
@@ -87,29 +125,31 @@ def build_plan(
         user_is_root=ctx.user_is_root,
         has_nvidia_smi=ctx.has_nvidia_smi,
         doctor_facts=ctx.doctor_facts,
-        env={**ctx.env, "ACCELERATE_PROFILE": normalized_profile},
+        env={**ctx.env, PROFILE_ENV_KEY: normalized_profile},
         cwd=ctx.cwd,
         repo_root=ctx.repo_root,
     )
 
-    for action in filtered_actions:
-        supported = False
-        before: dict[str, Any] = {}
-        check_notes: list[str] = []
-        plan_notes: list[str] = []
-        commands: list[str] = []
-        after_preview: dict[str, Any] = {}
-        recommended = False
+    probes: list[_Probe | None] = [None] * len(filtered_actions)
+    parallel_jobs = [index for index, action in enumerate(filtered_actions) if getattr(action, "parallel_safe", False)]
+    # Probes mostly wait on sysfs reads and subprocesses, so overlap the
+    # independent ones and run the rest in order afterwards.
+    if run_probes and len(parallel_jobs) > 1:
+        with ThreadPoolExecutor(max_workers=min(_MAX_PROBE_WORKERS, len(parallel_jobs))) as executor:
+            probed = executor.map(
+                _probe_action, [filtered_actions[index] for index in parallel_jobs], repeat(runtime_ctx)
+            )
+            for index, probe in zip(parallel_jobs, probed):
+                probes[index] = probe
 
-        try:
-            supported, before, check_notes = action.check(runtime_ctx)
-            if supported:
-                recommended, commands, after_preview, plan_notes = action.plan(runtime_ctx)
-        except Exception as exc:  # noqa: BLE001
-            supported = False
-            check_notes = [f"{type(exc).__name__}: {exc}"]
-
-        if action.risk.lower() == "high" and not expert_mode:
+    for index, action in enumerate(filtered_actions):
+        probe = probes[index]
+        if probe is None:
+            # Callers that only need action metadata skip the sysfs/nvidia-smi reads.
+            probe = _probe_action(action, runtime_ctx) if run_probes else (False, {}, [], False, [], {}, [])
+        supported, before, check_notes, recommended, commands, after_preview, plan_notes = probe
+
+        if action.risk.lower() == HIGH_RISK and not expert_mode:
             recommended = False
             plan_notes.append("High risk action is disabled unless expert profile is used")
 
@@ -1,3 +1,3 @@
-from continuum.launch.plugins.loader import HookBundle, PluginLoadResult, load_plugins, run_shell_hooks
+from continuum.launch.plugins.loader import HookBundle, PluginLoadResult, build_hook_env, load_plugins, run_shell_hooks
 
-__all__ = ["HookBundle", "PluginLoadResult", "load_plugins", "run_shell_hooks"]
+__all__ = ["HookBundle", "PluginLoadResult", "build_hook_env", "load_plugins", "run_shell_hooks"]
@@ -98,8 +98,22 @@ def load_plugins(register_action: Callable[[Any], None], cwd: Path | None = None
     )
 
 
-def run_shell_hooks(paths: list[Path], ctx: dict[str, Any], plan: dict[str, Any], selected_ids: set[str]) -> list[str]:
+def build_hook_env(ctx: dict[str, Any], selected_ids: set[str]) -> dict[str, str]:
+    return {**ctx.get("env", {}), "ACCELERATE_SELECTED_IDS": ",".join(sorted(selected_ids))}
+
+
+def run_shell_hooks(
+    paths: list[Path],
+    ctx: dict[str, Any],
+    plan: dict[str, Any],
+    selected_ids: set[str],
+    env: dict[str, str] | None = None,
+) -> list[str]:
     warnings: list[str] = []
+    if not paths:
+        return warnings
+
+    hook_env = env if env is not None else build_hook_env(ctx, selected_ids)
     for path in paths:
         try:
             completed = subprocess.run(
@@ -108,7 +122,7 @@ def run_shell_hooks(paths: list[Path], ctx: dict[str, Any], plan: dict[str, Any]
                 text=True,
                 timeout=20,
                 check=False,
-                env={**ctx.get("env", {}), "ACCELERATE_SELECTED_IDS": ",".join(sorted(selected_ids))},
+                env=hook_env,
             )
             if completed.returncode != 0:
                 warnings.append(f"Hook {path.name} failed: {completed.stderr.strip() or completed.stdout.strip()}")
@@ -121,5 +135,6 @@ __all__ = [
     "HookBundle",
     "PluginLoadResult",
     "load_plugins",
+    "build_hook_env",
     "run_shell_hooks",
 ]
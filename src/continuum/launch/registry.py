@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import Iterable
 
-from continuum.launch.models import PROFILE_ORDER, AccelerationAction
+from continuum.launch.models import DEFAULT_PROFILE, PROFILE_ORDER, AccelerationAction
 
 _REGISTRY: dict[str, AccelerationAction] = {}
 
@@ -27,16 +28,18 @@ def filter_actions(
     profile: str,
     categories: set[str] | None = None,
 ) -> list[AccelerationAction]:
-    required_level = PROFILE_ORDER.get(profile, PROFILE_ORDER["balanced"])
+    required_level = PROFILE_ORDER.get(profile, PROFILE_ORDER[DEFAULT_PROFILE])
     only_norm = {value.lower() for value in only} if only else None
     exclude_norm = {value.lower() for value in exclude} if exclude else None
     category_norm = {value.lower() for value in categories} if categories else None
 
     filtered: list[AccelerationAction] = []
+    profile_level = PROFILE_ORDER.get
+    minimal_level = PROFILE_ORDER["minimal"]
 
     for action in actions:
         action_category = action.category.lower()
-        action_profile_min = PROFILE_ORDER.get(action.profile_min, PROFILE_ORDER["minimal"])
+        action_profile_min = profile_level(action.profile_min, minimal_level)
 
         if action_profile_min > required_level:
             continue
@@ -52,7 +55,7 @@ def filter_actions(
 
         filtered.append(action)
 
-    return sorted(filtered, key=lambda item: item.id)
+    return sorted(filtered, key=attrgetter("id"))
 
 
 __all__ = [
@@ -1,64 +1,155 @@
 from __future__ import annotations
 
 import json
+import sys
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable
 
 try:
-    from rich.console import Console
+    import orjson
 except Exception:  # pragma: no cover
-    class Console:  # type: ignore[no-redef]
-        def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
-            pass
-
-        def print(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
-            print(*args)
+    orjson = None  # type: ignore[assignment]
 
 from continuum.launch.models import ACCELERATE_SCHEMA_VERSION, AccelerationActionResult, AccelerationPlan, ExecutionContext
 from continuum.launch.plugins.loader import PluginLoadResult
 
+if TYPE_CHECKING:
+    from rich.console import Console
 
-def write_json(path: Path, data: dict[str, Any]) -> None:
+
+class _FallbackConsole:
+    def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        pass
+
+    def print(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        print(*args)
+
+
+_DEFAULT_CONSOLE: Console | None = None
+
+
+def _default_console() -> Console:
+    # Deferred so report building and JSON output never import rich; cached so
+    # repeated renders reuse one console.
+    global _DEFAULT_CONSOLE
+    if _DEFAULT_CONSOLE is None:
+        try:
+            from rich.console import Console as RichConsole
+
+            _DEFAULT_CONSOLE = RichConsole()
+        except Exception:  # pragma: no cover
+            _DEFAULT_CONSOLE = _FallbackConsole()  # type: ignore[assignment]
+    return _DEFAULT_CONSOLE
+
+
+def dump_json(data: Any, *, sort_keys: bool = False, append_newline: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        if append_newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            # orjson rejects some payloads stdlib json accepts (non-str keys, huge ints).
+            pass
+    text = json.dumps(data, indent=2, sort_keys=sort_keys, ensure_ascii=False)
+    return (text + "\n" if append_newline else text).encode("utf-8")
+
+
+def print_json(data: Any, *, sort_keys: bool = True) -> None:
+    print_json_bytes(dump_json(data, sort_keys=sort_keys, append_newline=True))
+
+
+def print_json_bytes(payload: bytes) -> None:
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None or stream.isatty():
+        stream.write(payload.decode("utf-8"))
+        return
+    # Pipes and files get the encoded bytes directly; flush the text layer first
+    # so earlier prints keep their order.
+    stream.flush()
+    buffer.write(payload)
+    buffer.flush()
+
+
+def load_json(path: Path) -> Any:
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def write_json_bytes(path: Path, payload: bytes) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False) + "\n", encoding="utf-8")
+    path.write_bytes(payload)
+
+
+def write_json(path: Path, data: dict[str, Any]) -> None:
+    write_json_bytes(path, dump_json(data, sort_keys=True, append_newline=True))
 
 
-def write_state_report(report: dict[str, Any], out: Path | None = None, cwd: Path | None = None) -> Path:
+def write_state_report(
+    report: dict[str, Any],
+    out: Path | None = None,
+    cwd: Path | None = None,
+    payload: bytes | None = None,
+) -> Path:
     base = cwd if cwd is not None else Path.cwd()
     state_dir = base / ".hydra" / "state"
     latest_path = state_dir / "launch_latest.json"
-    write_json(latest_path, report)
+    # Serialize once and write the same bytes to every destination.
+    blob = payload if payload is not None else dump_json(report, sort_keys=True, append_newline=True)
+    write_json_bytes(latest_path, blob)
     if out is not None:
-        write_json(out, report)
+        write_json_bytes(out, blob)
     return latest_path
 
 
+def _compute_counts(results: list[AccelerationActionResult]) -> dict[str, int]:
+    # Single pass; "unsupported" overlaps with the other buckets so a Counter does not fit.
+    applied = skipped = unsupported = 0
+    for result in results:
+        if result.applied:
+            applied += 1
+        elif result.skipped_reason is not None:
+            skipped += 1
+        if not result.supported:
+            unsupported += 1
+    return {
+        "applied": applied,
+        "skipped": skipped,
+        "unsupported": unsupported,
+        "total": len(results),
+    }
+
+
+_by_action_id = attrgetter("action_id")
+
+
 def build_report(
     plan: AccelerationPlan,
     action_results: list[AccelerationActionResult],
     ctx: ExecutionContext,
-    selected_action_ids: set[str],
+    selected_action_ids: Iterable[str],
     dry_run: bool,
     plugin_result: PluginLoadResult,
     hook_warnings: list[str] | None = None,
 ) -> dict[str, Any]:
-    sorted_results = sorted(action_results, key=lambda result: result.action_id)
-    applied_count = sum(1 for result in sorted_results if result.applied)
-    unsupported_count = sum(1 for result in sorted_results if not result.supported)
-    skipped_count = sum(1 for result in sorted_results if not result.applied and result.skipped_reason is not None)
+    # Results normally arrive in plan order, which is already sorted by id.
+    sorted_results = action_results
+    if any(prev.action_id > cur.action_id for prev, cur in zip(action_results, action_results[1:])):
+        sorted_results = sorted(action_results, key=_by_action_id)
 
     return {
         "schema_version": ACCELERATE_SCHEMA_VERSION,
         "mode": "dry-run" if dry_run else "apply",
         "plan": plan.to_dict(),
         "context": ctx.to_dict(),
+        # Selections stay unordered sets upstream; order only at the JSON boundary.
         "selected_action_ids": sorted(selected_action_ids),
-        "summary": {
-            "applied": applied_count,
-            "skipped": skipped_count,
-            "unsupported": unsupported_count,
-            "total": len(action_results),
-        },
+        "summary": _compute_counts(sorted_results),
         "results": [result.to_dict() for result in sorted_results],
         "plugin_summary": {
             "actions_loaded": plugin_result.actions_loaded,
@@ -69,30 +160,60 @@ def build_report(
             "pre_apply_py_count": len(plugin_result.hooks.pre_apply_py),
             "post_apply_py_count": len(plugin_result.hooks.post_apply_py),
         },
-        "warnings": list(plan.warnings) + list(hook_warnings or []),
+        "warnings": [*plan.warnings, *(hook_warnings or ())],
     }
 
 
-def render_summary(report: dict[str, Any], console: Console | None = None) -> None:
-    active_console = console or Console()
+_SUMMARY_FIELDS = (
+    ("Applied", "applied"),
+    ("Skipped", "skipped"),
+    ("Unsupported", "unsupported"),
+)
+
+
+_RESULT_LABELS = ("SKIPPED", "APPLIED")
+_EMPTY_SUMMARY_LINE = "Launch Summary: Applied=0 Skipped=0 Unsupported=0"
+
+
+def format_summary_lines(report: dict[str, Any]) -> list[str]:
     summary = report.get("summary", {})
-    active_console.print(
-        "Launch Summary: "
-        f"Applied={summary.get('applied', 0)} "
-        f"Skipped={summary.get('skipped', 0)} "
-        f"Unsupported={summary.get('unsupported', 0)}"
-    )
-
-    for result in report.get("results", []):
-        status = "APPLIED" if result.get("applied") else "SKIPPED"
+    results = report.get("results")
+    if not results and not summary.get("total", 0):
+        # Counts are derived from results, so an empty report is always all zeros.
+        return [_EMPTY_SUMMARY_LINE]
+
+    lines = ["Launch Summary: " + " ".join(f"{label}={summary.get(key, 0)}" for label, key in _SUMMARY_FIELDS)]
+
+    for result in results or ():
+        status = _RESULT_LABELS[bool(result.get("applied"))]
         reason = result.get("skipped_reason")
         suffix = f" ({reason})" if reason else ""
-        active_console.print(f"- {result.get('action_id')}: {status}{suffix}")
+        lines.append(f"- {result.get('action_id')}: {status}{suffix}")
+    return lines
+
+
+def render_summary(report: dict[str, Any], console: Console | None = None) -> None:
+    lines = format_summary_lines(report)
+    if console is None and not sys.stdout.isatty():
+        # Non-interactive output: skip rich entirely.
+        for line in lines:
+            print(line)
+        return
+
+    active_console = console or _default_console()
+    for line in lines:
+        active_console.print(line)
 
 
 __all__ = [
+    "dump_json",
+    "load_json",
+    "print_json",
+    "print_json_bytes",
+    "write_json_bytes",
     "write_json",
     "write_state_report",
     "build_report",
+    "format_summary_lines",
     "render_summary",
 ]
@@ -29,7 +29,7 @@ except Exception:  # pragma: no cover
             response = input(rendered)
             return response if response else default
 
-from continuum.launch.models import ActionDescriptor
+from continuum.launch.models import HIGH_RISK, ActionDescriptor
 
 
 def select_actions_interactively(
@@ -38,7 +38,7 @@ def select_actions_interactively(
 ) -> set[str]:
     active_console = console or Console()
     default_selected = {
-        rec.action_id for rec in recommendations if rec.recommended and rec.supported and rec.risk.lower() != "high"
+        rec.action_id for rec in recommendations if rec.recommended and rec.supported and rec.risk.lower() != HIGH_RISK
     }
 
     table = Table(title="Accelerate Actions")
@@ -384,10 +384,8 @@ def _get_psutil() -> Any | None:
     if _PSUTIL_CACHE is not _PSUTIL_UNSET:
         return _PSUTIL_CACHE
 
-    if importlib.util.find_spec("psutil") is None:
-        _PSUTIL_CACHE = None
-        return None
-
+    # import_module already resolves the spec; probing with find_spec first
+    # would walk sys.path twice.
     try:
         _PSUTIL_CACHE = importlib.import_module("psutil")
     except Exception:
@@ -6,7 +6,6 @@ import subprocess
 import sys
 from datetime import datetime, timezone
 from importlib import import_module
-from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 from typing import Any
 
@@ -195,6 +194,8 @@ def _build_manifest(*, with_torch: bool, dry_run: bool) -> dict[str, Any]:
 
 
 def _safe_dist_version(dist_name: str) -> str | None:
+    from importlib.metadata import PackageNotFoundError, version
+
     try:
         return version(dist_name)
     except PackageNotFoundError:
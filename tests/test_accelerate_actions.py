@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from continuum.launch.actions import cpu_governor
+from continuum.launch.actions.nvidia_persistence import NvidiaPersistenceAction
+
+
+class TestCpuGovernorReads(unittest.TestCase):
+    def _make_policies(self, root: Path, governors: list[str]) -> None:
+        for index, governor in enumerate(governors):
+            policy = root / f"policy{index}"
+            policy.mkdir()
+            (policy / "scaling_governor").write_text(f"{governor}\n", encoding="utf-8")
+
+    def test_reads_one_governor_per_policy(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self._make_policies(root, ["performance", "powersave"])
+            with patch.object(cpu_governor, "_CPUFREQ_ROOT", str(root)):
+                governors = cpu_governor.read_cpu_governors()
+                current = cpu_governor.CpuGovernorAction()._read_governor()
+
+        self.assertEqual(governors, {"policy0": "performance", "policy1": "powersave"})
+        self.assertEqual(current, "performance,powersave")
+
+    def test_uniform_policies_collapse_to_single_governor(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self._make_policies(root, ["performance", "performance"])
+            with patch.object(cpu_governor, "_CPUFREQ_ROOT", str(root)):
+                current = cpu_governor.CpuGovernorAction()._read_governor()
+
+        self.assertEqual(current, "performance")
+
+    def test_apply_writes_governors_directly(self) -> None:
+        ctx = types.SimpleNamespace(is_linux=True, user_is_root=True, env={})
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self._make_policies(root, ["powersave", "powersave"])
+            with patch.object(cpu_governor, "_CPUFREQ_ROOT", str(root)), patch.object(
+                cpu_governor.subprocess, "run"
+            ) as run:
+                result = cpu_governor.CpuGovernorAction().apply(ctx)
+            contents = [(root / f"policy{index}" / "scaling_governor").read_text() for index in range(2)]
+
+        run.assert_not_called()
+        self.assertTrue(result.applied)
+        self.assertEqual(result.after["policies_written"], 2)
+        self.assertEqual(contents, ["performance", "performance"])
+
+    def test_plan_and_root_skip_advertise_the_sysfs_write(self) -> None:
+        ctx = types.SimpleNamespace(is_linux=True, user_is_root=False, env={})
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            self._make_policies(root, ["powersave"])
+            with patch.object(cpu_governor, "_CPUFREQ_ROOT", str(root)), patch.object(
+                cpu_governor, "which_cached", return_value="/usr/bin/cpupower"
+            ):
+                _, commands, _, notes = cpu_governor.CpuGovernorAction().plan(ctx)
+                result = cpu_governor.CpuGovernorAction().apply(ctx)
+
+        expected = f"echo performance > {root}/policy*/scaling_governor"
+        self.assertEqual(commands, [expected])
+        self.assertEqual(result.commands, (expected,))
+        self.assertTrue(any("cpupower" in note for note in notes))
+
+    def test_missing_sysfs_returns_none(self) -> None:
+        with patch.object(cpu_governor, "_CPUFREQ_ROOT", "/nonexistent/cpufreq"), patch.object(
+            cpu_governor, "_SCALING_GOVERNOR", "/nonexistent/scaling_governor"
+        ):
+            self.assertIsNone(cpu_governor.CpuGovernorAction()._read_governor())
+
+
+def _fake_pynvml(modes: list[int]) -> types.ModuleType:
+    module = types.ModuleType("pynvml")
+    module.nvmlInit = lambda: None
+    module.nvmlShutdown = lambda: None
+    module.nvmlDeviceGetCount = lambda: len(modes)
+    module.nvmlDeviceGetHandleByIndex = lambda idx: idx
+    module.nvmlDeviceGetPersistenceMode = lambda handle: modes[handle]
+
+    def _set_mode(handle: int, value: int) -> None:
+        modes[handle] = value
+
+    module.nvmlDeviceSetPersistenceMode = _set_mode
+    return module
+
+
+class TestNvidiaPersistenceNvml(unittest.TestCase):
+    def test_reads_persistence_without_subprocess(self) -> None:
+        with patch.dict(sys.modules, {"pynvml": _fake_pynvml([1, 0])}), patch(
+            "continuum.launch.actions.nvidia_persistence.subprocess.run"
+        ) as run:
+            ok, before, notes = NvidiaPersistenceAction()._read_persistence()
+
+        run.assert_not_called()
+        self.assertTrue(ok)
+        self.assertEqual(before["persistence_mode"], "disabled")
+        self.assertEqual(before["source"], "nvml")
+        self.assertEqual(notes, [])
+
+    def test_enables_persistence_via_nvml(self) -> None:
+        modes = [0, 0]
+        with patch.dict(sys.modules, {"pynvml": _fake_pynvml(modes)}):
+            errors = NvidiaPersistenceAction()._enable_persistence_nvml()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(modes, [1, 1])
+
+    def test_enable_defers_to_nvidia_smi_without_devices(self) -> None:
+        calls: list[str] = []
+        fake = _fake_pynvml([])
+        fake.nvmlShutdown = lambda: calls.append("shutdown")
+        with patch.dict(sys.modules, {"pynvml": fake}):
+            errors = NvidiaPersistenceAction()._enable_persistence_nvml()
+
+        self.assertIsNone(errors)
+        self.assertEqual(calls, ["shutdown"])
+
+    def test_falls_back_to_single_query_gpu_call(self) -> None:
+        completed = types.SimpleNamespace(
+            returncode=0,
+            stdout="Enabled, 300.00, 1980\nDisabled, 300.00, 1980\n",
+            stderr="",
+        )
+        with patch.dict(sys.modules, {"pynvml": None}), patch(
+            "continuum.launch.actions.nvidia_persistence.subprocess.run", return_value=completed
+        ) as run:
+            ok, before, notes = NvidiaPersistenceAction()._read_persistence()
+
+        run.assert_called_once()
+        self.assertIn("--query-gpu=persistence_mode,power.limit,clocks.max.sm", run.call_args.args[0])
+        self.assertTrue(ok)
+        self.assertEqual(before["persistence_mode"], "disabled")
+        self.assertEqual(before["gpus"][0], {"persistence_mode": "enabled", "power.limit": "300.00", "clocks.max.sm": "1980"})
+        self.assertEqual(notes, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
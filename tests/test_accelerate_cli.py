@@ -7,13 +7,46 @@ import unittest
 from importlib.util import find_spec
 from pathlib import Path
 
+from continuum.launch.models import AccelerationAction, AccelerationActionResult, ExecutionContext
+
 if find_spec("typer") is not None:
     from typer.testing import CliRunner
 
     from continuum.cli import app
+    from continuum.launch.cli import _apply_actions
 else:
     CliRunner = None
     app = None
+    _apply_actions = None
+
+
+class _ApplyAction(AccelerationAction):
+    def __init__(self, action_id: str, parallel_safe: bool, fail: bool = False) -> None:
+        self.id = action_id
+        self.title = action_id
+        self.category = "test"
+        self.why = "test"
+        self.parallel_safe = parallel_safe
+        self.fail = fail
+
+    def check(self, ctx: ExecutionContext):
+        return True, {}, []
+
+    def plan(self, ctx: ExecutionContext):
+        return True, [], {}, []
+
+    def apply(self, ctx: ExecutionContext):
+        if self.fail:
+            raise RuntimeError("boom")
+        return AccelerationActionResult(
+            action_id=self.id,
+            title=self.title,
+            supported=True,
+            applied=True,
+            skipped_reason=None,
+            requires_root=False,
+            risk="low",
+        )
 
 
 @unittest.skipIf(find_spec("typer") is None, "typer is not installed in this interpreter")
@@ -33,6 +66,20 @@ class TestAccelerateCli(unittest.TestCase):
             finally:
                 os.chdir(previous)
 
+    def test_redirected_human_output_is_plain_text(self) -> None:
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmp:
+            previous = Path.cwd()
+            try:
+                os.chdir(tmp)
+                result = runner.invoke(app, ["accelerate", "--dry-run", "--no-state-write"], catch_exceptions=False)
+                self.assertEqual(result.exit_code, 0)
+                self.assertIn("Hydra Launch Plan (balanced)", result.stderr)
+                self.assertIn("process.priority | process | low | no", result.stderr)
+                self.assertIn("Launch Summary:", result.stderr)
+            finally:
+                os.chdir(previous)
+
     def test_invalid_profile_returns_2(self) -> None:
         runner = CliRunner()
         result = runner.invoke(app, ["accelerate", "--profile", "ultra"], catch_exceptions=False)
@@ -68,5 +115,36 @@ class TestAccelerateCli(unittest.TestCase):
                 os.chdir(previous)
 
 
+@unittest.skipIf(find_spec("typer") is None, "typer is not installed in this interpreter")
+class TestApplyActions(unittest.TestCase):
+    def test_results_keep_plan_order_across_parallel_and_serial_actions(self) -> None:
+        actions = [
+            _ApplyAction("a.parallel", parallel_safe=True),
+            _ApplyAction("b.serial", parallel_safe=False),
+            _ApplyAction("c.parallel", parallel_safe=True, fail=True),
+            _ApplyAction("d.unselected", parallel_safe=True),
+            _ApplyAction("e.parallel", parallel_safe=True),
+        ]
+        internal_data = [{"action": action, "supported": True, "before": {}, "commands": []} for action in actions]
+        selected = {"a.parallel", "b.serial", "c.parallel", "e.parallel"}
+
+        results = _apply_actions(internal_data, selected, ctx=None)
+
+        self.assertEqual([result.action_id for result in results], [action.id for action in actions])
+        self.assertEqual([result.applied for result in results], [True, True, False, False, True])
+        self.assertEqual(results[2].errors, ["RuntimeError: boom"])
+        self.assertEqual(results[3].skipped_reason, "Not selected")
+
+    def test_empty_selection_skips_every_action(self) -> None:
+        actions = [_ApplyAction("a.parallel", parallel_safe=True), _ApplyAction("b.serial", parallel_safe=False, fail=True)]
+        internal_data = [{"action": action, "supported": True, "before": {}, "commands": []} for action in actions]
+
+        results = _apply_actions(internal_data, set(), ctx=None)
+
+        self.assertEqual([result.applied for result in results], [False, False])
+        self.assertEqual([result.skipped_reason for result in results], ["Not selected", "Not selected"])
+        self.assertEqual([result.errors for result in results], [[], []])
+
+
 if __name__ == "__main__":
     unittest.main()
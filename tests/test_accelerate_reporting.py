@@ -7,7 +7,7 @@ from pathlib import Path
 
 from continuum.accelerate.models import ActionDescriptor, AccelerationActionResult, AccelerationPlan, ExecutionContext
 from continuum.accelerate.plugins.loader import HookBundle, PluginLoadResult
-from continuum.accelerate.reporting import build_report, write_state_report
+from continuum.accelerate.reporting import build_report, dump_json, format_summary_lines, write_state_report
 
 
 class TestAccelerateReporting(unittest.TestCase):
@@ -69,6 +69,27 @@ class TestAccelerateReporting(unittest.TestCase):
             self.assertEqual(payload["mode"], "dry-run")
             self.assertIn("plugin_summary", payload)
 
+        self.assertEqual(
+            format_summary_lines(report),
+            [
+                "Launch Summary: Applied=0 Skipped=1 Unsupported=0",
+                "- process.priority: SKIPPED (Dry run - not applied)",
+            ],
+        )
+
+    def test_format_summary_lines_for_empty_report(self) -> None:
+        self.assertEqual(
+            format_summary_lines({"summary": {"applied": 0, "skipped": 0, "unsupported": 0, "total": 0}, "results": []}),
+            ["Launch Summary: Applied=0 Skipped=0 Unsupported=0"],
+        )
+        self.assertEqual(format_summary_lines({}), ["Launch Summary: Applied=0 Skipped=0 Unsupported=0"])
+
+    def test_dump_json_matches_stdlib_layout(self) -> None:
+        data = {"b": [1, 2], "a": {"nested": "ok", "unicode": "é"}, "empty": {}}
+        expected = json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        self.assertEqual(dump_json(data, sort_keys=True), expected)
+        self.assertEqual(json.loads(dump_json(data)), data)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,22 +1,32 @@
 from __future__ import annotations
 
 import subprocess
+import sys
 import unittest
+from types import ModuleType
 from unittest.mock import patch
 
+from continuum.doctor.checks.base import run_teardown
 from continuum.doctor.checks.cuda import (
+    _driver_version_from_nvml,
+    _truncate_text,
     CudaDriverCompatCheck,
     CudaDriverVersionCheck,
     CudaToolkitNvccCheck,
 )
-from continuum.doctor.models import Status
+from continuum.doctor.models import CheckResult, Status
+
+
+def _which_nvidia_smi_only(name: str) -> str | None:
+    return "/usr/bin/nvidia-smi" if name == "nvidia-smi" else None
 
 
 class TestCudaChecks(unittest.TestCase):
+    @patch("continuum.doctor.checks.cuda._nvidia_device_present", return_value=True)
     @patch("continuum.doctor.checks.cuda._driver_version_from_nvml", return_value=None)
     @patch("continuum.doctor.checks.cuda.shutil.which", return_value="/usr/bin/nvidia-smi")
     @patch("continuum.doctor.checks.cuda.subprocess.run")
-    def test_driver_version_parsing_from_nvidia_smi(self, mock_run, _mock_which, _mock_nvml) -> None:
+    def test_driver_version_parsing_from_nvidia_smi(self, mock_run, _mock_which, _mock_nvml, _mock_dev) -> None:
         mock_run.return_value = subprocess.CompletedProcess(
             args=["nvidia-smi", "--query-gpu=driver_version", "--format=csv,noheader"],
             returncode=0,
@@ -28,6 +38,35 @@ class TestCudaChecks(unittest.TestCase):
         self.assertEqual(result.status, Status.PASS)
         self.assertEqual(result.details["driver_version"], "550.54.14")
 
+    @patch("continuum.doctor.checks.cuda._nvidia_device_present", return_value=True)
+    @patch("continuum.doctor.checks.cuda._driver_version_from_nvml", return_value=None)
+    @patch("continuum.doctor.checks.cuda.shutil.which", return_value="/usr/bin/nvidia-smi")
+    @patch("continuum.doctor.checks.cuda.subprocess.run")
+    def test_nvidia_smi_output_is_reused_within_one_run(self, mock_run, _mock_which, mock_nvml, _mock_dev) -> None:
+        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="550.54.14\n", stderr="")
+        ctx = {"facts": {}, "results": {}}
+
+        CudaDriverVersionCheck().run(ctx)
+        result = CudaDriverVersionCheck().run(ctx)
+
+        self.assertEqual(result.details["driver_version"], "550.54.14")
+        self.assertEqual(mock_run.call_count, 1)
+        self.assertEqual(mock_nvml.call_count, 1)
+
+    @patch("continuum.doctor.checks.cuda._nvidia_device_present", return_value=True)
+    @patch("continuum.doctor.checks.cuda._driver_version_from_nvml", return_value=None)
+    @patch("continuum.doctor.checks.cuda.shutil.which", return_value="/usr/bin/nvidia-smi")
+    @patch("continuum.doctor.checks.cuda.subprocess.run")
+    def test_driver_version_reports_persistence_mode(self, mock_run, _mock_which, _mock_nvml, _mock_dev) -> None:
+        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="550.54.14, NVIDIA A100-SXM4-80GB, Disabled\n", stderr="")
+        result = CudaDriverVersionCheck().run({"facts": {}, "results": {}})
+
+        self.assertEqual(mock_run.call_count, 1)
+        self.assertEqual(result.details["driver_version"], "550.54.14")
+        self.assertEqual(result.details["gpu_name"], "NVIDIA A100-SXM4-80GB")
+        self.assertEqual(result.details["persistence_mode"], "disabled")
+        self.assertIn("nvidia-smi -pm 1", result.remediation[0])
+
     def test_driver_cuda_compat_matrix_fail_warn_pass(self) -> None:
         check = CudaDriverCompatCheck()
 
@@ -40,6 +79,12 @@ class TestCudaChecks(unittest.TestCase):
         pass_result = check.run({"facts": {"driver_version": "550.80.00", "torch_cuda_version": "12.4"}})
         self.assertEqual(pass_result.status, Status.PASS)
 
+        patch_release_result = check.run({"facts": {"driver_version": "550.80.00", "torch_cuda_version": "12.4.1"}})
+        self.assertEqual(patch_release_result.details["required_min_driver"], "550.54.14")
+
+        suffixed_result = check.run({"facts": {"driver_version": "535.54.03-grid", "torch_cuda_version": "12.2"}})
+        self.assertEqual(suffixed_result.status, Status.PASS)
+
     @patch("continuum.doctor.checks.cuda.shutil.which", return_value="/usr/local/cuda/bin/nvcc")
     @patch("continuum.doctor.checks.cuda.subprocess.run")
     def test_nvcc_detection_parses_version(self, mock_run, _mock_which) -> None:
@@ -54,6 +99,124 @@ class TestCudaChecks(unittest.TestCase):
         self.assertEqual(result.status, Status.PASS)
         self.assertEqual(result.details["nvcc_version"], "12.4")
 
+    @patch("continuum.doctor.checks.cuda._is_linux_or_windows", return_value=True)
+    def test_nvcc_skipped_when_no_driver_and_no_gpu(self, _mock_platform) -> None:
+        driver = CheckResult(
+            id="cuda.driver_version",
+            title="CUDA Driver Version",
+            category="driver",
+            status=Status.WARN,
+            message="Unable to detect NVIDIA driver version.",
+        )
+        ctx = {"facts": {}, "results": {"cuda.driver_version": driver}}
+
+        with patch.dict("os.environ", {}, clear=True):
+            self.assertFalse(CudaToolkitNvccCheck().should_run(ctx))
+        with patch.dict("os.environ", {"CONTINUUM_REQUIRE_NVCC": "1"}, clear=True):
+            self.assertTrue(CudaToolkitNvccCheck().should_run(ctx))
+        ctx["facts"]["gpu_count"] = 1
+        with patch.dict("os.environ", {}, clear=True):
+            self.assertTrue(CudaToolkitNvccCheck().should_run(ctx))
+
+    @patch("continuum.doctor.checks.cuda._nvidia_device_present", return_value=True)
+    @patch("continuum.doctor.checks.cuda._driver_version_from_nvml", return_value=None)
+    @patch("continuum.doctor.checks.cuda.shutil.which", side_effect=_which_nvidia_smi_only)
+    @patch("continuum.doctor.checks.cuda.subprocess.run")
+    def test_compat_check_reads_canonical_driver_version(self, mock_run, _mock_which, _mock_nvml, _mock_dev) -> None:
+        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="550.80.00, NVIDIA A100, Enabled\n", stderr="")
+        ctx = {"facts": {"torch_cuda_version": "12.4"}, "results": {}}
+
+        CudaDriverVersionCheck().run(ctx)
+        compat = CudaDriverCompatCheck()
+        self.assertTrue(compat.should_run(ctx))
+        result = compat.run(ctx)
+
+        self.assertEqual(ctx["facts"]["driver_version"], "550.80.00")
+        self.assertEqual(result.status, Status.PASS)
+        self.assertEqual(mock_run.call_count, 1)
+
+    def test_truncate_text_strips_and_bounds_output(self) -> None:
+        self.assertEqual(_truncate_text(None), "")
+        self.assertEqual(_truncate_text("  ok \n"), "ok")
+        self.assertEqual(_truncate_text("  abc  ", limit=3), "abc")
+        self.assertEqual(_truncate_text("\n" + "x" * 10 + "\n", limit=4), "xxxx...<truncated>")
+
+    def test_nvml_driver_version_uses_loaded_module(self) -> None:
+        fake_nvml = ModuleType("pynvml")
+        fake_nvml.nvmlInit = lambda: None
+        fake_nvml.nvmlShutdown = lambda: None
+        fake_nvml.nvmlSystemGetDriverVersion = lambda: b"550.54.14"
+
+        with patch.dict(sys.modules, {"pynvml": fake_nvml}):
+            self.assertEqual(_driver_version_from_nvml({"facts": {}}), "550.54.14")
+
+    def test_nvml_driver_version_reuses_shared_session(self) -> None:
+        calls: list[str] = []
+        fake_nvml = ModuleType("pynvml")
+        fake_nvml.nvmlInit = lambda: calls.append("init")
+        fake_nvml.nvmlShutdown = lambda: calls.append("shutdown")
+        fake_nvml.nvmlSystemGetDriverVersion = lambda: "550.54.14"
+        ctx: dict[str, object] = {"facts": {}}
+
+        with patch.dict(sys.modules, {"pynvml": fake_nvml}):
+            self.assertEqual(_driver_version_from_nvml(ctx), "550.54.14")
+            self.assertEqual(_driver_version_from_nvml(ctx), "550.54.14")
+            self.assertEqual(calls, ["init"])
+            run_teardown(ctx)
+        self.assertEqual(calls, ["init", "shutdown"])
+
+    @patch.dict("os.environ", {}, clear=True)
+    @patch("continuum.doctor.checks.cuda._driver_version_from_nvml")
+    @patch("continuum.doctor.checks.cuda._nvidia_device_present", return_value=False)
+    @patch("continuum.doctor.checks.cuda.shutil.which", return_value="/usr/bin/nvidia-smi")
+    @patch("continuum.doctor.checks.cuda.subprocess.run")
+    def test_driver_check_short_circuits_without_device(self, mock_run, mock_which, _mock_dev, mock_nvml) -> None:
+        result = CudaDriverVersionCheck().run({"facts": {}, "results": {}})
+
+        self.assertEqual(result.status, Status.WARN)
+        mock_which.assert_not_called()
+        mock_nvml.assert_not_called()
+        mock_run.assert_not_called()
+
+    @patch.dict("os.environ", {"CONTINUUM_PROBE_NVIDIA_SMI": "1"})
+    @patch("continuum.doctor.checks.cuda._driver_version_from_nvml", return_value=None)
+    @patch("continuum.doctor.checks.cuda._nvidia_device_present", return_value=False)
+    @patch("continuum.doctor.checks.cuda.shutil.which", return_value="/usr/bin/nvidia-smi")
+    @patch("continuum.doctor.checks.cuda.subprocess.run")
+    def test_driver_check_probes_nvidia_smi_when_opted_in(self, mock_run, _mock_which, _mock_dev, _mock_nvml) -> None:
+        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="550.54.14\n", stderr="")
+
+        result = CudaDriverVersionCheck().run({"facts": {}, "results": {}})
+
+        self.assertEqual(result.status, Status.PASS)
+        self.assertEqual(result.details["method_used"], "nvidia-smi")
+
+    @patch("continuum.doctor.checks.cuda._nvidia_device_present", return_value=True)
+    @patch("continuum.doctor.checks.cuda._driver_version_from_nvml", return_value="550.54.14")
+    @patch("continuum.doctor.checks.cuda.shutil.which", return_value="/usr/bin/nvidia-smi")
+    @patch("continuum.doctor.checks.cuda.subprocess.run")
+    def test_driver_check_spawns_nothing_when_nvml_resolves(self, mock_run, _mock_which, _mock_nvml, _mock_dev) -> None:
+        result = CudaDriverVersionCheck().run({"facts": {}, "results": {}})
+
+        self.assertEqual(result.details["method_used"], "nvml")
+        mock_run.assert_not_called()
+
+    def test_nvml_shutdown_skipped_when_init_fails(self) -> None:
+        calls: list[str] = []
+        fake_nvml = ModuleType("pynvml")
+
+        def _init() -> None:
+            raise RuntimeError("no driver")
+
+        fake_nvml.nvmlInit = _init
+        fake_nvml.nvmlShutdown = lambda: calls.append("shutdown")
+
+        ctx: dict[str, object] = {"facts": {}}
+        with patch.dict(sys.modules, {"pynvml": fake_nvml}):
+            self.assertIsNone(_driver_version_from_nvml(ctx))
+            run_teardown(ctx)
+        self.assertEqual(calls, [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,6 +7,7 @@ from types import ModuleType
 from unittest.mock import patch
 
 from continuum.doctor.checks.gpu import (
+    GpuClockThrottleReasonsCheck,
     GpuPersistenceModeCheck,
     NvidiaSmiCheck,
     NvmlAvailableCheck,
@@ -14,27 +15,34 @@ from continuum.doctor.checks.gpu import (
     RuntimeGpuPassthroughCheck,
 )
 from continuum.doctor.models import Status
+from continuum.doctor.runner import DoctorRunner
+from continuum.doctor.utils import nvml
+from continuum.doctor.utils.nvml import NvmlSession
 
 
 class TestGpuChecks(unittest.TestCase):
-    @patch("continuum.doctor.checks.gpu.platform.system", return_value="Darwin")
-    def test_gpu_checks_skip_on_macos(self, _mock_system) -> None:
+    @patch("continuum.doctor.checks.gpu.IS_LINUX", False)
+    @patch("continuum.doctor.checks.gpu.IS_LINUX_OR_WINDOWS", False)
+    def test_gpu_checks_skip_on_macos(self) -> None:
         self.assertFalse(NvidiaSmiCheck().should_run({}))
         self.assertFalse(NvmlAvailableCheck().should_run({}))
         self.assertFalse(NvmlDevicesCheck().should_run({}))
         self.assertFalse(RuntimeGpuPassthroughCheck().should_run({"is_container": True}))
 
-    @patch("continuum.doctor.checks.gpu.platform.system", return_value="Linux")
+    @patch("continuum.doctor.checks.gpu.IS_LINUX", True)
+    @patch("continuum.doctor.checks.gpu.IS_LINUX_OR_WINDOWS", True)
     @patch("continuum.doctor.checks.gpu.shutil.which", return_value=None)
-    def test_nvidia_smi_missing_is_fail(self, _mock_which, _mock_system) -> None:
+    def test_nvidia_smi_missing_is_fail(self, _mock_which) -> None:
         result = NvidiaSmiCheck().run({"facts": {}, "results": {}})
         self.assertEqual(result.status, Status.FAIL)
         self.assertIn("not found", result.message.lower())
+        self.assertIsInstance(result.remediation, list)
 
-    @patch("continuum.doctor.checks.gpu.platform.system", return_value="Linux")
+    @patch("continuum.doctor.checks.gpu.IS_LINUX", True)
+    @patch("continuum.doctor.checks.gpu.IS_LINUX_OR_WINDOWS", True)
     @patch("continuum.doctor.checks.gpu.shutil.which", return_value="/usr/bin/nvidia-smi")
     @patch("continuum.doctor.checks.gpu.subprocess.run")
-    def test_nvidia_smi_success_is_pass(self, mock_run, _mock_which, _mock_system) -> None:
+    def test_nvidia_smi_success_is_pass(self, mock_run, _mock_which) -> None:
         mock_run.return_value = subprocess.CompletedProcess(
             args=["nvidia-smi", "-L"],
             returncode=0,
@@ -46,8 +54,101 @@ class TestGpuChecks(unittest.TestCase):
         self.assertEqual(result.status, Status.PASS)
         self.assertTrue(ctx["facts"]["nvidia_smi_ok"])
 
-    @patch("continuum.doctor.checks.gpu.platform.system", return_value="Linux")
-    def test_persistence_mode_warn_when_off(self, _mock_system) -> None:
+    @patch("continuum.doctor.checks.gpu._nvidia_device_nodes", return_value=[])
+    @patch("continuum.doctor.checks.gpu.shutil.which", return_value="/usr/bin/nvidia-smi")
+    @patch("continuum.doctor.checks.gpu.subprocess.run")
+    def test_nvidia_smi_lookup_is_shared_between_checks(self, mock_run, mock_which, _mock_glob) -> None:
+        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="GPU 0: Example", stderr="")
+        ctx = {"facts": {}, "results": {}, "is_container": True}
+
+        NvidiaSmiCheck().run(ctx)
+        result = RuntimeGpuPassthroughCheck().run(ctx)
+
+        self.assertEqual(result.status, Status.PASS)
+        self.assertEqual(mock_which.call_count, 1)
+        self.assertEqual(mock_run.call_count, 1)
+
+    @patch("continuum.doctor.checks.gpu._nvidia_device_nodes", return_value=["/dev/nvidia0", "/dev/nvidiactl"])
+    @patch("continuum.doctor.checks.gpu.shutil.which", return_value="/usr/bin/nvidia-smi")
+    @patch("continuum.doctor.checks.gpu.subprocess.run")
+    def test_passthrough_skips_nvidia_smi_when_device_nodes_exist(self, mock_run, _mock_which, _mock_nodes) -> None:
+        result = RuntimeGpuPassthroughCheck().run({"facts": {}, "results": {}, "is_container": True})
+
+        self.assertEqual(result.status, Status.PASS)
+        self.assertIsNone(result.details["nvidia_smi_returncode"])
+        mock_run.assert_not_called()
+
+    @patch("continuum.doctor.checks.gpu._nvidia_device_nodes", return_value=[])
+    @patch("continuum.doctor.checks.gpu.shutil.which", return_value="/usr/bin/nvidia-smi")
+    @patch("continuum.doctor.checks.gpu.subprocess.run")
+    def test_nvidia_smi_timeout_is_not_retried_by_passthrough_check(self, mock_run, _mock_which, _mock_glob) -> None:
+        mock_run.side_effect = subprocess.TimeoutExpired(cmd=["nvidia-smi", "-L"], timeout=15)
+        ctx = {"facts": {}, "results": {}, "is_container": True}
+
+        smi_result = NvidiaSmiCheck().run(ctx)
+        passthrough_result = RuntimeGpuPassthroughCheck().run(ctx)
+
+        self.assertEqual(smi_result.status, Status.FAIL)
+        self.assertEqual(passthrough_result.status, Status.FAIL)
+        self.assertIn("timed out", passthrough_result.details["nvidia_smi_stderr"])
+        self.assertEqual(mock_run.call_count, 1)
+
+    @patch("continuum.doctor.checks.gpu.shutil.which", return_value="/usr/bin/nvidia-smi")
+    @patch("continuum.doctor.checks.gpu.subprocess.run")
+    def test_nvidia_smi_check_lists_devices_via_nvml(self, mock_run, _mock_which) -> None:
+        fake_nvml = ModuleType("pynvml")
+        fake_nvml.nvmlInit = lambda: None
+        fake_nvml.nvmlShutdown = lambda: None
+        fake_nvml.nvmlDeviceGetCount = lambda: 1
+        fake_nvml.nvmlDeviceGetHandleByIndex = lambda idx: idx
+        fake_nvml.nvmlDeviceGetName = lambda handle: b"Example GPU"
+        fake_nvml.nvmlDeviceGetUUID = lambda handle: "GPU-1234"
+
+        original_nvml = sys.modules.get("pynvml")
+        sys.modules["pynvml"] = fake_nvml
+        try:
+            ctx = {"facts": {}, "results": {}}
+            result = NvidiaSmiCheck().run(ctx)
+        finally:
+            if original_nvml is not None:
+                sys.modules["pynvml"] = original_nvml
+            else:
+                sys.modules.pop("pynvml", None)
+
+        self.assertEqual(result.status, Status.PASS)
+        self.assertEqual(result.details["stdout"], "GPU 0: Example GPU (UUID: GPU-1234)")
+        self.assertTrue(ctx["facts"]["nvidia_smi_ok"])
+        mock_run.assert_not_called()
+
+    @patch("continuum.doctor.checks.gpu.IS_LINUX", True)
+    @patch("continuum.doctor.checks.gpu.IS_LINUX_OR_WINDOWS", True)
+    @patch("continuum.doctor.checks.gpu.nvml_session")
+    @patch("continuum.doctor.checks.gpu.shutil.which", return_value="/usr/bin/nvidia-smi")
+    @patch("continuum.doctor.checks.gpu.subprocess.run")
+    def test_devices_enumerated_via_smi_csv_without_pynvml(self, mock_run, _mock_which, mock_session) -> None:
+        mock_session.return_value = NvmlSession(None, import_error="ModuleNotFoundError: No module named 'pynvml'")
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[],
+            returncode=0,
+            stdout="0, NVIDIA A100, Enabled, 41, 63.50, 0x0000000000000000\n1, NVIDIA A100, Disabled, [N/A], [N/A], 0x0000000000000004\n",
+            stderr="",
+        )
+        ctx = {"facts": {}, "results": {"gpu.nvml_available": type("Result", (), {"status": Status.WARN})()}}
+
+        check = NvmlDevicesCheck()
+        self.assertTrue(check.should_run(ctx))
+        result = check.run(ctx)
+
+        self.assertEqual(result.status, Status.PASS)
+        self.assertEqual(ctx["facts"]["gpu_count"], 2)
+        self.assertEqual(result.details["source"], "nvidia-smi")
+        self.assertIsNone(result.details["devices"][1]["temperature_c"])
+        self.assertEqual(result.details["devices"][1]["throttle_flags"], 4)
+        self.assertEqual(mock_run.call_count, 1)
+
+    @patch("continuum.doctor.checks.gpu.IS_LINUX", True)
+    @patch("continuum.doctor.checks.gpu.IS_LINUX_OR_WINDOWS", True)
+    def test_persistence_mode_warn_when_off(self) -> None:
         fake_nvml = ModuleType("pynvml")
         fake_nvml.nvmlInit = lambda: None
         fake_nvml.nvmlShutdown = lambda: None
@@ -72,6 +173,127 @@ class TestGpuChecks(unittest.TestCase):
             else:
                 sys.modules.pop("pynvml", None)
 
+    @patch("continuum.doctor.checks.gpu.IS_LINUX", True)
+    @patch("continuum.doctor.checks.gpu.IS_LINUX_OR_WINDOWS", True)
+    def test_nvml_session_reuses_remembered_import_failure(self) -> None:
+        original_nvml = sys.modules.pop("pynvml", None)
+        try:
+            with patch.object(nvml, "_PYNVML_IMPORT_ERROR", "ModuleNotFoundError: No module named 'pynvml'"):
+                session = nvml.nvml_session({"facts": {}})
+        finally:
+            if original_nvml is not None:
+                sys.modules["pynvml"] = original_nvml
+
+        self.assertIsNone(session.pynvml)
+        self.assertEqual(session.import_error, "ModuleNotFoundError: No module named 'pynvml'")
+
+    def test_nvml_session_is_shared_and_shut_down_once(self) -> None:
+        calls: list[str] = []
+        handle_lookups: list[int] = []
+        fake_nvml = ModuleType("pynvml")
+        fake_nvml.nvmlInit = lambda: calls.append("init")
+        fake_nvml.nvmlShutdown = lambda: calls.append("shutdown")
+        fake_nvml.nvmlDeviceGetCount = lambda: 1
+        fake_nvml.nvmlDeviceGetHandleByIndex = lambda idx: handle_lookups.append(idx) or idx
+        fake_nvml.nvmlDeviceGetName = lambda handle: b"Example GPU"
+        fake_nvml.nvmlDeviceGetPersistenceMode = lambda handle: 1
+
+        original_nvml = sys.modules.get("pynvml")
+        sys.modules["pynvml"] = fake_nvml
+        try:
+            runner = DoctorRunner(
+                hydra_version="test",
+                checks=[NvmlAvailableCheck, NvmlDevicesCheck, GpuPersistenceModeCheck],
+            )
+            report = runner.run({"deterministic": True})
+        finally:
+            if original_nvml is not None:
+                sys.modules["pynvml"] = original_nvml
+            else:
+                sys.modules.pop("pynvml", None)
+
+        self.assertEqual([check.status for check in report.checks], [Status.PASS] * 3)
+        self.assertEqual(calls, ["init", "shutdown"])
+        self.assertEqual(handle_lookups, [0])
+
+
+    def test_nvml_checks_scan_devices_beyond_reported_details(self) -> None:
+        fake_nvml = ModuleType("pynvml")
+        fake_nvml.nvmlInit = lambda: None
+        fake_nvml.nvmlShutdown = lambda: None
+        fake_nvml.nvmlDeviceGetCount = lambda: 10
+        fake_nvml.nvmlDeviceGetHandleByIndex = lambda idx: idx
+        fake_nvml.nvmlDeviceGetName = lambda handle: f"GPU {handle}"
+        fake_nvml.nvmlClocksThrottleReasonHwSlowdown = 0x8
+        fake_nvml.nvmlDeviceGetPersistenceMode = lambda handle: 0 if handle == 9 else 1
+        fake_nvml.nvmlDeviceGetCurrentClocksThrottleReasons = lambda handle: 0x8 if handle == 9 else 0
+        fake_nvml.nvmlDeviceGetTemperature = lambda handle, sensor: 60
+        fake_nvml.nvmlDeviceGetPowerUsage = lambda handle: 100000
+
+        original_nvml = sys.modules.get("pynvml")
+        sys.modules["pynvml"] = fake_nvml
+        try:
+            ctx = {"facts": {}, "results": {}}
+            devices = NvmlDevicesCheck().run(ctx)
+            persistence = GpuPersistenceModeCheck().run(ctx)
+            throttle = GpuClockThrottleReasonsCheck().run(ctx)
+        finally:
+            if original_nvml is not None:
+                sys.modules["pynvml"] = original_nvml
+            else:
+                sys.modules.pop("pynvml", None)
+
+        self.assertEqual(devices.details["gpu_count"], 10)
+        self.assertEqual(len(devices.details["gpu_names"]), 8)
+        self.assertEqual(persistence.status, Status.WARN)
+        self.assertEqual(persistence.details["off_gpu_indices"], [9])
+        self.assertEqual(len(persistence.details["persistence_modes"]), 8)
+        self.assertEqual(throttle.status, Status.WARN)
+        self.assertEqual(len(throttle.details["devices"]), 8)
+
+    def test_nvml_checks_share_one_device_snapshot(self) -> None:
+        queries: list[str] = []
+
+        def _query(name, value):
+            def _call(*_args):
+                queries.append(name)
+                if isinstance(value, Exception):
+                    raise value
+                return value
+
+            return _call
+
+        fake_nvml = ModuleType("pynvml")
+        fake_nvml.nvmlInit = lambda: None
+        fake_nvml.nvmlShutdown = lambda: None
+        fake_nvml.nvmlDeviceGetCount = lambda: 1
+        fake_nvml.nvmlDeviceGetHandleByIndex = lambda idx: idx
+        fake_nvml.nvmlClocksThrottleReasonSwPowerCap = 0x4
+        fake_nvml.nvmlDeviceGetPersistenceMode = _query("persistence", 1)
+        fake_nvml.nvmlDeviceGetCurrentClocksThrottleReasons = _query("throttle", 0x4)
+        fake_nvml.nvmlDeviceGetTemperature = _query("temperature", RuntimeError("unsupported"))
+        fake_nvml.nvmlDeviceGetPowerUsage = _query("power", 250_000)
+
+        original_nvml = sys.modules.get("pynvml")
+        sys.modules["pynvml"] = fake_nvml
+        try:
+            ctx = {"facts": {}, "results": {}}
+            persistence = GpuPersistenceModeCheck().run(ctx)
+            throttle = GpuClockThrottleReasonsCheck().run(ctx)
+        finally:
+            if original_nvml is not None:
+                sys.modules["pynvml"] = original_nvml
+            else:
+                sys.modules.pop("pynvml", None)
+
+        self.assertEqual(persistence.status, Status.PASS)
+        self.assertEqual(throttle.status, Status.WARN)
+        device = throttle.details["devices"][0]
+        self.assertEqual(device["reasons"], ["sw_power_cap"])
+        self.assertIsNone(device["temperature_c"])
+        self.assertEqual(device["power_watts"], 250.0)
+        self.assertEqual(sorted(queries), ["persistence", "power", "temperature", "throttle"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,6 +11,7 @@ from continuum.doctor.models import CheckResult, Status
 class _FakeCuda:
     def __init__(self, props):
         self._props = props
+        self.property_calls = 0
 
     def is_available(self) -> bool:
         return True
@@ -19,6 +20,7 @@ class _FakeCuda:
         return len(self._props)
 
     def get_device_properties(self, index: int):
+        self.property_calls += 1
         return self._props[index]
 
 
@@ -50,6 +52,10 @@ class TestGpuPropsChecks(unittest.TestCase):
             result = GpuDevicePropertiesCheck().run(ctx)
             self.assertEqual(result.status, Status.WARN)
             self.assertEqual(result.details["device_count"], 2)
+            self.assertEqual([device["compute_capability"] for device in result.details["devices"]], ["6.1", "8.0"])
+
+            GpuDevicePropertiesCheck().run(ctx)
+            self.assertEqual(fake_torch.cuda.property_calls, 2)
         finally:
             if original_torch is not None:
                 sys.modules["torch"] = original_torch
@@ -46,6 +46,23 @@ class TestModels(unittest.TestCase):
         self.assertEqual(payload["details"], {"current": "3.12.3"})
         self.assertEqual(payload["remediation"], ["none"])
 
+    def test_check_result_to_dict_copies_only_on_request(self) -> None:
+        result = CheckResult(
+            id="x.y",
+            title="x",
+            category="x",
+            status=Status.WARN,
+            message="x",
+            details={"current": "3.12.3"},
+            remediation=["none"],
+        )
+
+        self.assertIs(result.to_dict()["details"], result.details)
+        self.assertIsInstance(result.to_dict()["remediation"], list)
+        copied = result.to_dict(copy=True)
+        self.assertIsNot(copied["details"], result.details)
+        self.assertIsNot(copied["remediation"], result.remediation)
+
     def test_report_rejects_negative_total_duration(self) -> None:
         env = EnvironmentInfo(
             timestamp_utc="2026-01-01T00:00:00+00:00",
@@ -11,8 +11,8 @@ from continuum.doctor.models import CheckResult, Status
 
 
 class TestNcclChecks(unittest.TestCase):
-    @patch("continuum.doctor.checks.nccl.platform.system", return_value="Linux")
-    def test_env_config_warns_on_suspicious_vars(self, _mock_system) -> None:
+    @patch("continuum.doctor.checks.nccl.IS_LINUX", True)
+    def test_env_config_warns_on_suspicious_vars(self) -> None:
         check = NcclEnvConfigCheck()
         with patch.dict(
             os.environ,
@@ -22,8 +22,8 @@ class TestNcclChecks(unittest.TestCase):
             result = check.run({"facts": {"gpu_count": 2}, "is_container": False})
         self.assertEqual(result.status, Status.WARN)
 
-    @patch("continuum.doctor.checks.nccl.platform.system", return_value="Linux")
-    def test_torch_backend_warns_when_multi_gpu_and_nccl_missing(self, _mock_system) -> None:
+    @patch("continuum.doctor.checks.nccl.IS_LINUX", True)
+    def test_torch_backend_warns_when_multi_gpu_and_nccl_missing(self) -> None:
         fake_dist = ModuleType("torch.distributed")
         fake_dist.is_available = lambda: True
         fake_dist.is_nccl_available = lambda: False
@@ -61,5 +61,23 @@ class TestNcclChecks(unittest.TestCase):
                 sys.modules.pop("torch.distributed", None)
 
 
+    @patch("continuum.doctor.checks.nccl.IS_LINUX", True)
+    def test_torch_backend_skips_distributed_import_on_single_gpu(self) -> None:
+        original_dist = sys.modules.get("torch.distributed")
+        # A None entry makes any import of torch.distributed raise.
+        sys.modules["torch.distributed"] = None
+        try:
+            result = NcclTorchBackendCheck().run({"facts": {"gpu_count": 1}, "results": {}})
+        finally:
+            if original_dist is not None:
+                sys.modules["torch.distributed"] = original_dist
+            else:
+                sys.modules.pop("torch.distributed", None)
+
+        self.assertEqual(result.status, Status.PASS)
+        self.assertEqual(result.details["skipped_reason"], "single-gpu")
+        self.assertNotIn("import_error", result.details)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import sys
 import unittest
 from types import SimpleNamespace
 from unittest.mock import patch
 
-from continuum.doctor.checks.pytorch import PytorchInstalledCheck
+from continuum.doctor.checks.pytorch import (
+    PytorchCudaAvailableCheck,
+    PytorchCudaVersionCheck,
+    PytorchInstalledCheck,
+)
 from continuum.doctor.models import Status
 
 
@@ -26,6 +31,93 @@ class TestPytorchChecks(unittest.TestCase):
         self.assertEqual(result.status, Status.PASS)
         self.assertTrue(ctx["facts"]["torch_installed"])
 
+    @patch("continuum.doctor.checks.pytorch.load_torch")
+    @patch(
+        "continuum.doctor.checks.pytorch.importlib.util.find_spec",
+        return_value=SimpleNamespace(origin="/venv/lib/python/site-packages/torch/__init__.py"),
+    )
+    def test_checks_share_one_torch_probe(self, mock_find_spec, mock_load) -> None:
+        calls = {"is_available": 0}
+
+        def is_available() -> bool:
+            calls["is_available"] += 1
+            return True
+
+        mock_load.return_value = SimpleNamespace(
+            __version__="2.3.0+cu121",
+            version=SimpleNamespace(cuda="12.1"),
+            backends=SimpleNamespace(cudnn=SimpleNamespace(version=lambda: 8902)),
+            cuda=SimpleNamespace(is_available=is_available),
+        )
+        ctx = {"facts": {"gpu_count": 1}, "results": {}}
+        installed = PytorchInstalledCheck().run(ctx)
+        available = PytorchCudaAvailableCheck().run(ctx)
+        version = PytorchCudaVersionCheck().run(ctx)
+
+        self.assertEqual(installed.status, Status.PASS)
+        self.assertEqual(available.status, Status.PASS)
+        self.assertEqual(version.details["cudnn_version"], 8902)
+        self.assertEqual(mock_find_spec.call_count, 1)
+        self.assertEqual(mock_load.call_count, 1)
+        self.assertEqual(calls["is_available"], 1)
+
+    @patch(
+        "continuum.doctor.checks.pytorch.load_torch",
+        side_effect=ImportError("libcudart.so missing"),
+    )
+    @patch(
+        "continuum.doctor.checks.pytorch.importlib.util.find_spec",
+        return_value=SimpleNamespace(origin="/venv/lib/python/site-packages/torch/__init__.py"),
+    )
+    def test_cuda_checks_report_cached_import_error(self, _mock_find_spec, mock_load) -> None:
+        ctx = {"facts": {}, "results": {}}
+        available = PytorchCudaAvailableCheck().run(ctx)
+        version = PytorchCudaVersionCheck().run(ctx)
+
+        self.assertEqual(available.status, Status.FAIL)
+        self.assertEqual(version.details["import_error"], "ImportError: libcudart.so missing")
+        self.assertEqual(mock_load.call_count, 1)
+    @patch("continuum.doctor.checks.pytorch.importlib.util.find_spec")
+    def test_installed_uses_already_imported_torch(self, mock_find_spec) -> None:
+        fake_torch = SimpleNamespace(
+            __file__="/venv/lib/python/site-packages/torch/__init__.py",
+            __version__="2.3.0",
+            version=SimpleNamespace(cuda=None),
+            cuda=SimpleNamespace(is_available=lambda: False),
+        )
+        ctx = {"facts": {}, "results": {}}
+        with patch.dict(sys.modules, {"torch": fake_torch}):
+            result = PytorchInstalledCheck().run(ctx)
+
+        self.assertEqual(result.status, Status.PASS)
+        self.assertEqual(result.details["origin"], fake_torch.__file__)
+        self.assertIs(ctx["facts"]["_torch"], fake_torch)
+        mock_find_spec.assert_not_called()
+
+    @patch("continuum.doctor.checks.pytorch.load_torch")
+    @patch(
+        "continuum.doctor.checks.pytorch.importlib.util.find_spec",
+        return_value=SimpleNamespace(origin="/venv/lib/python/site-packages/torch/__init__.py"),
+    )
+    def test_cuda_init_failure_only_affects_cuda_available(self, _mock_find_spec, mock_load) -> None:
+        def is_available() -> bool:
+            raise RuntimeError("CUDA driver initialization failed")
+
+        mock_load.return_value = SimpleNamespace(
+            __version__="2.3.0+cu121",
+            version=SimpleNamespace(cuda="12.1"),
+            cuda=SimpleNamespace(is_available=is_available),
+        )
+        ctx = {"facts": {}, "results": {}}
+        installed = PytorchInstalledCheck().run(ctx)
+        available = PytorchCudaAvailableCheck().run(ctx)
+        version = PytorchCudaVersionCheck().run(ctx)
+
+        self.assertEqual(installed.status, Status.PASS)
+        self.assertEqual(available.status, Status.FAIL)
+        self.assertEqual(available.details["cuda_error"], "RuntimeError: CUDA driver initialization failed")
+        self.assertEqual(version.status, Status.PASS)
+
 
 if __name__ == "__main__":
     unittest.main()